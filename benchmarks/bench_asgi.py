@@ -0,0 +1,161 @@
+"""Пропускная способность страниц на чтение под WSGI и под ASGI.
+
+Запуск из корня репозитория:
+
+    python benchmarks/bench_asgi.py --scale small --concurrency 32
+
+Каждый режим запускается в своём процессе: под WSGI запросы идут из
+пула потоков (поток на запрос, как у многопоточного сервера), под ASGI --
+из задач asyncio через AsyncClient, а представления выполняются в пуле
+ASYNC_VIEW_THREADS потоков. Кроме задержек записывается, сколько потоков
+понадобилось процессу.
+"""
+import argparse
+import asyncio
+import json
+import os
+import queue
+import random
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from bench_endpoints import RESULTS_DIR, Scenarios, git_commit, summarize
+from dataset import DEFAULT_DATABASE, SCALES, seed, setup_django
+
+MODES = ('wsgi', 'asgi')
+READS = ('index', 'category', 'profile', 'detail')
+
+
+def make_urls(count, rng):
+    scenarios = Scenarios(rng)
+    urls = [
+        getattr(scenarios, READS[number % len(READS)])()[1]
+        for number in range(count)
+    ]
+    return scenarios.user, urls
+
+
+def run_wsgi(user, urls, concurrency):
+    from django.test import Client
+
+    clients = queue.Queue()
+    for _ in range(concurrency):
+        client = Client()
+        client.force_login(user)
+        clients.put(client)
+    local = threading.local()
+
+    def fetch(url):
+        if not hasattr(local, 'client'):
+            local.client = clients.get()
+        started = time.perf_counter()
+        response = local.client.get(url)
+        return time.perf_counter() - started, response.status_code
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(fetch, urls))
+        threads = threading.active_count()
+    return results, time.perf_counter() - started, threads
+
+
+def run_asgi(user, urls, concurrency):
+    from django.test import AsyncClient
+
+    client = AsyncClient()
+    client.force_login(user)
+    pending = iter(urls)
+    results = []
+
+    async def worker():
+        for url in pending:
+            started = time.perf_counter()
+            response = await client.get(url)
+            results.append(
+                (time.perf_counter() - started, response.status_code)
+            )
+
+    async def main():
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    started = time.perf_counter()
+    asyncio.run(main())
+    return results, time.perf_counter() - started, threading.active_count()
+
+
+def run_mode(args):
+    setup_django(args.database)
+    size = SCALES[args.scale]
+    seed(**size, seed=args.seed)
+    user, urls = make_urls(args.warmup + args.requests, random.Random(0))
+    run = run_wsgi if args.mode == 'wsgi' else run_asgi
+    run(user, urls[:args.warmup], args.concurrency)
+    results, elapsed, threads = run(
+        user, urls[args.warmup:], args.concurrency
+    )
+    summary = summarize(
+        [latency for latency, _ in results],
+        elapsed,
+        sum(status >= 400 for _, status in results)
+    )
+    summary['threads'] = threads
+    json.dump(summary, sys.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    parser.add_argument('--database', type=Path, default=DEFAULT_DATABASE)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--warmup', type=int, default=40)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path)
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.mode:
+        run_mode(args)
+        return
+
+    report = {
+        'commit': git_commit(),
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'concurrency': args.concurrency,
+        'modes': {},
+    }
+    for mode in MODES:
+        completed = subprocess.run(
+            (
+                sys.executable, __file__, '--mode', mode,
+                '--scale', args.scale,
+                '--database', str(args.database),
+                '--requests', str(args.requests),
+                '--warmup', str(args.warmup),
+                '--concurrency', str(args.concurrency),
+                '--seed', str(args.seed),
+            ),
+            env={**os.environ, 'BLOG_ASYNC_VIEWS': str(int(mode == 'asgi'))},
+            stdout=subprocess.PIPE,
+            check=True,
+            text=True
+        )
+        report['modes'][mode] = json.loads(completed.stdout)
+    output = args.output or RESULTS_DIR / f'{report["commit"]}-asgi.json'
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    columns = ('rps', 'p50_ms', 'p95_ms', 'p99_ms', 'threads')
+    print(f'{"режим":<8}' + ''.join(f'{name:>10}' for name in columns))
+    for mode, summary in report['modes'].items():
+        print(f'{mode:<8}' + ''.join(
+            f'{summary[name]:>10}' for name in columns
+        ))
+    print(f'Результаты: {output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""Чтение страниц во время всплесков записи комментариев.
+
+Запуск из корня репозитория:
+
+    python benchmarks/bench_concurrency.py --scale small --duration 20
+
+Каждый профиль SQLite запускается в своём процессе: tuned -- настройки
+по умолчанию (WAL, synchronous=NORMAL, busy_timeout, mmap), rollback --
+журнал DELETE без остальных PRAGMA (SQLITE_TUNING=0). Потоки-читатели всё
+время открывают страницы, потоки-писатели пачками добавляют комментарии
+через add_comment и делают паузу. У каждого потока своё соединение с
+базой, поэтому блокировки SQLite работают так же, как между процессами
+сервера. Записываются задержки чтения и число ошибок блокировки.
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from bench_endpoints import RESULTS_DIR, Scenarios, git_commit, summarize
+from dataset import DEFAULT_DATABASE, SCALES, seed, setup_django
+
+PROFILES = {
+    'rollback': '0',
+    'tuned': '1',
+}
+READS = ('index', 'category', 'profile', 'detail')
+
+
+def request(client, scenario):
+    """Возвращает (задержка, успех); «database is locked» -- неуспех."""
+    from django.db import OperationalError
+
+    method, url, data = scenario()
+    started = time.perf_counter()
+    try:
+        response = getattr(client, method)(url, data or {})
+    except OperationalError:
+        return time.perf_counter() - started, False
+    return time.perf_counter() - started, response.status_code < 400
+
+
+def reader(number, deadline, results):
+    from django.db import connection
+    from django.test import Client
+
+    scenarios = Scenarios(random.Random(number))
+    client = Client()
+    client.force_login(scenarios.user)
+    while time.perf_counter() < deadline:
+        name = scenarios.rng.choice(READS)
+        results.append(request(client, getattr(scenarios, name)))
+    connection.close()
+
+
+def writer(number, deadline, results, burst, pause):
+    from django.db import connection
+    from django.test import Client
+
+    scenarios = Scenarios(random.Random(-number - 1))
+    client = Client()
+    client.force_login(scenarios.user)
+    while time.perf_counter() < deadline:
+        for _ in range(burst):
+            results.append(request(client, scenarios.add_comment))
+        time.sleep(pause)
+    connection.close()
+
+
+def run_profile(args):
+    setup_django(args.database)
+    seed(**SCALES[args.scale], seed=args.seed)
+    from django.db import connection
+
+    connection.close()
+    reads, writes = [], []
+    deadline = time.perf_counter() + args.duration
+    threads = [
+        threading.Thread(target=reader, args=(number, deadline, reads))
+        for number in range(args.readers)
+    ] + [
+        threading.Thread(
+            target=writer,
+            args=(number, deadline, writes, args.burst, args.pause)
+        )
+        for number in range(args.writers)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    json.dump({
+        'reads': summarize(
+            [latency for latency, _ in reads],
+            elapsed,
+            sum(not ok for _, ok in reads)
+        ),
+        'writes': summarize(
+            [latency for latency, _ in writes],
+            elapsed,
+            sum(not ok for _, ok in writes)
+        ),
+    }, sys.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    parser.add_argument('--database', type=Path, default=DEFAULT_DATABASE)
+    parser.add_argument('--duration', type=float, default=20)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--burst', type=int, default=20)
+    parser.add_argument('--pause', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path)
+    parser.add_argument(
+        '--profile', choices=PROFILES, help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+    if args.profile:
+        run_profile(args)
+        return
+
+    report = {
+        'commit': git_commit(),
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'readers': args.readers,
+        'writers': args.writers,
+        'burst': args.burst,
+        'profiles': {},
+    }
+    for profile, tuning in PROFILES.items():
+        completed = subprocess.run(
+            (
+                sys.executable, __file__, '--profile', profile,
+                '--scale', args.scale,
+                '--database', str(args.database),
+                '--duration', str(args.duration),
+                '--readers', str(args.readers),
+                '--writers', str(args.writers),
+                '--burst', str(args.burst),
+                '--pause', str(args.pause),
+                '--seed', str(args.seed),
+            ),
+            env={**os.environ, 'SQLITE_TUNING': tuning},
+            stdout=subprocess.PIPE,
+            check=True,
+            text=True
+        )
+        report['profiles'][profile] = json.loads(completed.stdout)
+    output = args.output or (
+        RESULTS_DIR / f'{report["commit"]}-concurrency.json'
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    columns = ('rps', 'p50_ms', 'p95_ms', 'p99_ms', 'errors')
+    print(f'{"профиль":<18}' + ''.join(f'{name:>10}' for name in columns))
+    for profile, result in report['profiles'].items():
+        for kind, summary in result.items():
+            print(f'{profile + ":" + kind:<18}' + ''.join(
+                f'{summary[name]:>10}' for name in columns
+            ))
+    print(f'Результаты: {output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
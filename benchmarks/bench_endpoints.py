@@ -0,0 +1,219 @@
+"""Задержки и пропускная способность страниц блога.
+
+Запуск из корня репозитория:
+
+    python benchmarks/bench_endpoints.py --scale small --requests 200
+    python benchmarks/bench_endpoints.py --compare benchmarks/results/old.json
+
+Скрипт создаёт отдельную базу (по умолчанию benchmarks/blogicum.sqlite3),
+наполняет её синтетическими данными через bulk_create и гоняет запросы
+через WSGI-обработчик в том же процессе (django.test.Client). Результаты
+пишутся в JSON, чтобы сравнивать их между коммитами.
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dataset import DEFAULT_DATABASE, SCALES, dataset_size, seed, setup_django
+
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+PERCENTILES = (50, 90, 95, 99)
+SAMPLE_SIZE = 10_000
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    index = min(len(values) - 1, round(percent / 100 * (len(values) - 1)))
+    return values[index]
+
+
+def summarize(latencies, elapsed, errors):
+    summary = {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': round(len(latencies) / elapsed, 1),
+        'mean_ms': round(statistics.mean(latencies) * 1000, 2),
+    }
+    for percent in PERCENTILES:
+        summary[f'p{percent}_ms'] = round(
+            percentile(latencies, percent) * 1000, 2
+        )
+    return summary
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ('git', 'rev-parse', '--short', 'HEAD'),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+class Scenarios:
+    """Сценарии нагрузки: метод возвращает (метод, URL, данные)."""
+
+    def __init__(self, rng):
+        from blog.models import Category, Post, User
+
+        self.rng = rng
+        self.user = User.objects.get(username='user0')
+        published = Post.custom_objects.published_post()
+        self.post_ids = list(
+            published.values_list('pk', flat=True)[:SAMPLE_SIZE]
+        )
+        self.slugs = list(
+            Category.objects.filter(is_published=True).values_list(
+                'slug', flat=True
+            )
+        )
+        self.usernames = list(
+            User.objects.values_list('username', flat=True)[:SAMPLE_SIZE]
+        )
+        self.own_posts = list(
+            Post.objects.filter(author=self.user).values(
+                'pk', 'category', 'location'
+            )
+        )
+
+    def index(self):
+        return 'get', f'/?page={self.rng.randint(1, 5)}', None
+
+    def category(self):
+        return 'get', f'/category/{self.rng.choice(self.slugs)}/', None
+
+    def profile(self):
+        return 'get', f'/profile/{self.rng.choice(self.usernames)}/', None
+
+    def detail(self):
+        return 'get', f'/posts/{self.rng.choice(self.post_ids)}/', None
+
+    def add_comment(self):
+        return 'post', f'/posts/{self.rng.choice(self.post_ids)}/comment/', {
+            'text': f'Комментарий {self.rng.random()}'
+        }
+
+    def edit(self):
+        post = self.rng.choice(self.own_posts)
+        return 'post', f'/posts/{post["pk"]}/edit/', {
+            'title': f'Публикация {self.rng.random()}',
+            'text': 'Обновлённый текст публикации.',
+            'pub_date': '2020-01-01T00:00',
+            'category': post['category'],
+            'location': post['location'] or '',
+        }
+
+
+READS = ('index', 'category', 'profile', 'detail')
+WRITES = ('add_comment', 'edit')
+
+
+def run_scenario(client, scenario, requests, warmup):
+    latencies = []
+    errors = 0
+    started = time.perf_counter()
+    for number in range(warmup + requests):
+        method, url, data = scenario()
+        request_started = time.perf_counter()
+        response = getattr(client, method)(url, data or {})
+        latency = time.perf_counter() - request_started
+        if number < warmup:
+            started = time.perf_counter()
+            continue
+        latencies.append(latency)
+        if response.status_code >= 400:
+            errors += 1
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+def run(requests, warmup, rng):
+    from django.test import Client
+
+    scenarios = Scenarios(rng)
+    user_client = Client()
+    user_client.force_login(scenarios.user)
+    results = {}
+    for name in READS:
+        results[name] = run_scenario(
+            user_client, getattr(scenarios, name), requests, warmup
+        )
+        results[f'{name}:anonymous'] = run_scenario(
+            Client(), getattr(scenarios, name), requests, warmup
+        )
+    for name in WRITES:
+        if name == 'edit' and not scenarios.own_posts:
+            continue
+        results[name] = run_scenario(
+            user_client, getattr(scenarios, name), requests, warmup
+        )
+    return results
+
+
+def print_results(results, baseline=None):
+    columns = ('rps', *(f'p{percent}_ms' for percent in PERCENTILES))
+    print(f'{"сценарий":<22}' + ''.join(f'{name:>12}' for name in columns))
+    for name, summary in results.items():
+        line = f'{name:<22}' + ''.join(
+            f'{summary[column]:>12}' for column in columns
+        )
+        old = (baseline or {}).get(name)
+        if old:
+            line += f'   p95 {summary["p95_ms"] - old["p95_ms"]:+.2f} мс'
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', choices=SCALES, default='small')
+    parser.add_argument('--users', type=int)
+    parser.add_argument('--posts', type=int)
+    parser.add_argument('--comments', type=int)
+    parser.add_argument('--database', type=Path, default=DEFAULT_DATABASE)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', type=Path)
+    parser.add_argument('--compare', type=Path)
+    args = parser.parse_args()
+
+    size = dict(SCALES[args.scale])
+    for key in size:
+        if getattr(args, key) is not None:
+            size[key] = getattr(args, key)
+    setup_django(args.database)
+    seed(**size, seed=args.seed)
+
+    import django
+    from django.db import connection
+
+    results = run(args.requests, args.warmup, random.Random(args.seed))
+    commit = git_commit()
+    report = {
+        'commit': commit,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'database': connection.vendor,
+        'dataset': dataset_size(),
+        'scenarios': results,
+    }
+    output = args.output or RESULTS_DIR / f'{commit}.json'
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    baseline = None
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())['scenarios']
+    print_results(results, baseline)
+    print(f'Результаты: {output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
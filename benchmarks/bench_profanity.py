@@ -0,0 +1,60 @@
+"""Время проверки текста фильтром мата в зависимости от размера словаря.
+
+Запуск из корня репозитория:
+
+    python benchmarks/bench_profanity.py
+
+Автомат Ахо-Корасик проходит текст один раз, поэтому время проверки
+почти не растёт при увеличении словаря на порядки, в отличие от прежней
+проверки «слово in текст» для каждого слова словаря.
+"""
+import random
+import string
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'blogicum'))
+
+from blog.profanity import AhoCorasick, normalize  # noqa: E402
+
+DICTIONARY_SIZES = (10, 1_000, 10_000, 100_000)
+TEXT_WORDS = 1_000
+REPEAT = 20
+ALPHABET = 'абвгдежзийклмнопрстуфхцчшщъыьэюя' + string.ascii_lowercase
+
+
+def random_word(rng, min_length=4, max_length=10):
+    return ''.join(
+        rng.choice(ALPHABET)
+        for _ in range(rng.randint(min_length, max_length))
+    )
+
+
+def main():
+    rng = random.Random(0)
+    text = normalize(' '.join(random_word(rng) for _ in range(TEXT_WORDS)))
+    print(f'Текст: {len(text)} символов, повторов: {REPEAT}')
+    print(
+        f'{"слов в словаре":>15} {"построение, с":>15}'
+        f' {"автомат, мс":>15} {"подстроки, мс":>15}'
+    )
+    for size in DICTIONARY_SIZES:
+        words = {normalize(random_word(rng, 6, 12)) for _ in range(size)}
+        started = timeit.default_timer()
+        matcher = AhoCorasick(words)
+        build_time = timeit.default_timer() - started
+        check_time = min(timeit.repeat(
+            lambda: matcher.find(text), number=1, repeat=REPEAT
+        ))
+        naive_time = min(timeit.repeat(
+            lambda: any(word in text for word in words), number=1, repeat=3
+        ))
+        print(
+            f'{size:>15} {build_time:>15.3f}'
+            f' {check_time * 1000:>15.3f} {naive_time * 1000:>15.3f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
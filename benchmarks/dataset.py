@@ -0,0 +1,157 @@
+"""Настройка Django и синтетические данные для бенчмарков.
+
+Данные создаются через bulk_create пачками, без сигналов моделей; после
+вставки пересчитываются счётчики комментариев, лента и поисковый индекс.
+"""
+import os
+import random
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'blogicum'))
+
+DEFAULT_DATABASE = Path(__file__).resolve().parent / 'blogicum.sqlite3'
+BENCH_PASSWORD = 'bench-password'
+BATCH_SIZE = 10_000
+SCALES = {
+    'small': {'users': 1_000, 'posts': 10_000, 'comments': 100_000},
+    'medium': {'users': 10_000, 'posts': 100_000, 'comments': 1_000_000},
+    'large': {'users': 100_000, 'posts': 1_000_000, 'comments': 10_000_000},
+}
+CATEGORIES = 50
+LOCATIONS = 200
+
+
+def setup_django(database=DEFAULT_DATABASE):
+    """Поднимает Django с отдельной базой и без DEBUG."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blogicum.settings')
+    from django.conf import settings
+
+    settings.DEBUG = False
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'testserver']
+    if settings.DATABASES['default']['ENGINE'].endswith('sqlite3'):
+        settings.DATABASES['default']['NAME'] = str(database)
+
+    import django
+
+    django.setup()
+    from django.core.management import call_command
+
+    call_command('migrate', verbosity=0)
+
+
+def batches(items, size=BATCH_SIZE):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def insert(model, objects, label):
+    started = time.perf_counter()
+    total = 0
+    for batch in batches(objects):
+        model.objects.bulk_create(batch)
+        total += len(batch)
+    print(
+        f'{label}: {total} за {time.perf_counter() - started:.1f} с',
+        file=sys.stderr
+    )
+
+
+def dataset_size():
+    from blog.models import Comment, Post, User
+
+    return {
+        'users': User.objects.count(),
+        'posts': Post.objects.count(),
+        'comments': Comment.objects.count(),
+    }
+
+
+def seed(users, posts, comments, seed=0):
+    """Наполняет пустую базу; уже заполненную оставляет как есть.
+
+    Комментарии не сверяются: сценарии записи добавляют их при каждом
+    прогоне.
+    """
+    from django.contrib.auth.hashers import make_password
+    from django.utils import timezone
+
+    from blog import feed
+    from blog.models import Category, Comment, Location, Post, User
+    from blog.search import get_search_backend
+
+    size = dataset_size()
+    if size['users'] == users and size['posts'] == posts:
+        return
+    if size['posts']:
+        raise SystemExit(
+            'База бенчмарка уже заполнена другим объёмом данных;'
+            ' удалите её или передайте --database.'
+        )
+    rng = random.Random(seed)
+    now = timezone.now()
+    password = make_password(BENCH_PASSWORD)
+    insert(User, (
+        User(
+            username=f'user{index}',
+            email=f'user{index}@example.com',
+            password=password,
+        )
+        for index in range(users)
+    ), 'Пользователи')
+    insert(Category, (
+        Category(
+            title=f'Категория {index}',
+            slug=f'category-{index}',
+            description='Описание категории',
+        )
+        for index in range(CATEGORIES)
+    ), 'Категории')
+    insert(Location, (
+        Location(name=f'Место {index}') for index in range(LOCATIONS)
+    ), 'Местоположения')
+    user_ids = list(User.objects.values_list('pk', flat=True))
+    category_ids = list(Category.objects.values_list('pk', flat=True))
+    location_ids = list(Location.objects.values_list('pk', flat=True))
+    insert(Post, (
+        Post(
+            title=f'Публикация {index}',
+            text=f'Текст публикации {index} о блоге и производительности.',
+            pub_date=now - timedelta(minutes=rng.randrange(60 * 24 * 365)),
+            author_id=rng.choice(user_ids),
+            category_id=rng.choice(category_ids),
+            location_id=rng.choice(location_ids),
+            is_published=rng.random() > 0.05,
+        )
+        for index in range(posts)
+    ), 'Публикации')
+    first_post, last_post = (
+        Post.objects.order_by('pk').values_list('pk', flat=True)[0],
+        Post.objects.order_by('-pk').values_list('pk', flat=True)[0],
+    )
+    insert(Comment, (
+        Comment(
+            text=f'Комментарий {index}',
+            post_id=rng.randint(first_post, last_post),
+            author_id=rng.choice(user_ids),
+        )
+        for index in range(comments)
+    ), 'Комментарии')
+    started = time.perf_counter()
+    Post.custom_objects.recount_comments()
+    feed.rebuild()
+    get_search_backend().rebuild()
+    print(
+        'Счётчики, лента и поисковый индекс:'
+        f' {time.perf_counter() - started:.1f} с',
+        file=sys.stderr
+    )
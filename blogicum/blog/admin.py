@@ -1,11 +1,49 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import PAGE_VAR
 
-from .models import Category, Comment, Location, Post
+from .exports import export_response
+from .models import Category, Comment, Location, OutboxMessage, Post
+from .paginators import EstimatedCountPaginator
 
 
 admin.site.empty_value_display = 'Не задано'
 
 
+class LargeTableMixin:
+    """Список без полного COUNT(*) и лишних запросов на строку."""
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_paginator(
+        self, request, queryset, per_page, orphans=0,
+        allow_empty_first_page=True
+    ):
+        try:
+            page_hint = max(int(request.GET.get(PAGE_VAR, 1)), 1)
+        except ValueError:
+            page_hint = 1
+        return self.paginator(
+            queryset, per_page, orphans, allow_empty_first_page,
+            page_hint=page_hint
+        )
+
+
+class ExportMixin:
+    actions = (
+        'export_csv',
+        'export_jsonl',
+    )
+
+    @admin.action(description='Выгрузить выбранные в CSV')
+    def export_csv(self, request, queryset):
+        return export_response(queryset, 'csv')
+
+    @admin.action(description='Выгрузить выбранные в JSON Lines')
+    def export_jsonl(self, request, queryset):
+        return export_response(queryset, 'jsonl')
+
+
 class PostInline(admin.TabularInline):
     model = Post
     extra = 0
@@ -56,7 +94,7 @@ class LocationAdmin(admin.ModelAdmin):
 
 
 @admin.register(Post)
-class PostAdmin(admin.ModelAdmin):
+class PostAdmin(LargeTableMixin, ExportMixin, admin.ModelAdmin):
     list_display = (
         'title',
         'text',
@@ -69,39 +107,70 @@ class PostAdmin(admin.ModelAdmin):
     )
     list_editable = (
         'pub_date',
+        'is_published',
+    )
+    list_select_related = (
         'author',
         'location',
-        'is_published',
-        'category'
+        'category',
+    )
+    autocomplete_fields = (
+        'author',
+        'location',
+        'category',
     )
     search_fields = (
         'title',
+        '=author__username',
     )
     list_filter = (
+        'is_published',
         'category',
-        'pub_date',
-        'location',
-        'author',
     )
+    date_hierarchy = 'pub_date'
     list_display_links = (
         'title',
     )
 
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(LargeTableMixin, ExportMixin, admin.ModelAdmin):
     list_display = (
         'text',
         'author',
         'post',
         'created_at'
     )
-    list_editable = (
+    list_select_related = (
+        'author',
+        'post',
+    )
+    raw_id_fields = (
+        'post',
+    )
+    autocomplete_fields = (
         'author',
     )
     search_fields = (
-        'author__username',
+        '=author__username',
+    )
+    date_hierarchy = 'created_at'
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = (
+        'recipient',
+        'subject',
+        'attempts',
+        'next_attempt_at',
+        'sent_at',
+        'created_at'
     )
     list_filter = (
-        'author',
+        'sent_at',
+    )
+    search_fields = (
+        'recipient',
+        'subject',
     )
@@ -0,0 +1,226 @@
+import hashlib
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Min
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from .models import Category, Post, User
+from blogicum.constants import (
+    LOOKUP_CACHE_TIMEOUT, PAGE_CACHE_TIMEOUT, POST_CARD_CACHE_TIMEOUT
+)
+from core.db import reads_from_replicas
+
+
+def version_key(tag):
+    return f'blog:version:{tag}'
+
+
+def new_version():
+    return str(time.time_ns())
+
+
+# Входит в версию любой записи: bump(ALL_TAG) сбрасывает весь кеш блога.
+ALL_TAG = 'all'
+
+
+def get_versions(*tags):
+    """Версии тегов; первой идёт версия ALL_TAG."""
+    keys = [version_key(tag) for tag in (ALL_TAG, *tags)]
+    versions = cache.get_many(keys)
+    missing = {key: new_version() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def version_datetime(version):
+    return datetime.fromtimestamp(int(version) / 10 ** 9, dt_timezone.utc)
+
+
+def settled(versions, started):
+    """Все изменения под этими версиями видны запросу, начатому в started.
+
+    Реплика может получить запись с опозданием до REPLICA_MAX_LAG секунд,
+    поэтому для чтения с реплик граница сдвигается назад: иначе старые
+    данные закешируются уже под новой версией.
+    """
+    limit = int(started)
+    if reads_from_replicas():
+        limit -= settings.REPLICA_MAX_LAG * 10 ** 9
+    return all(int(version) <= limit for version in versions)
+
+
+def bump(*tags):
+    """Сбрасывает всё, что закешировано с этими тегами.
+
+    Версии меняются сразу и ещё раз после коммита: иначе параллельный
+    запрос успеет закешировать старые данные уже под новой версией.
+    """
+    def set_versions():
+        cache.set_many(
+            {version_key(tag): new_version() for tag in tags}, None
+        )
+
+    set_versions()
+    transaction.on_commit(set_versions)
+
+
+def post_tags(post):
+    return (
+        f'post:{post.pk}',
+        f'author:{post.author_id}',
+        f'category:{post.category_id}',
+        f'location:{post.location_id}',
+    )
+
+
+def category_key(slug):
+    return f'blog:category:{slug}'
+
+
+def user_key(username):
+    return f'blog:user:{username}'
+
+
+def _cached_lookup(key, queryset, **lookup):
+    all_key = version_key(ALL_TAG)
+    cached = cache.get_many([key, all_key])
+    version = cached.get(all_key)
+    if version is not None and key in cached:
+        cached_version, obj = cached[key]
+        if cached_version == version:
+            return obj
+    obj = queryset.filter(**lookup).first()
+    # forget() мог пройти до того, как изменение дошло до реплики.
+    if obj is not None and version is not None and not reads_from_replicas():
+        cache.set(key, (version, obj), LOOKUP_CACHE_TIMEOUT)
+    return obj
+
+
+def get_published_category(slug):
+    """Опубликованная категория по slug или None."""
+    return _cached_lookup(
+        category_key(slug),
+        Category.objects.filter(is_published=True),
+        slug=slug
+    )
+
+
+def get_user(username):
+    """Пользователь по username или None."""
+    return _cached_lookup(
+        user_key(username), User.objects.defer('password'), username=username
+    )
+
+
+def forget(*keys):
+    """Удаляет записи сразу и ещё раз после коммита, как и bump()."""
+    def delete_keys():
+        cache.delete_many(keys)
+
+    delete_keys()
+    transaction.on_commit(delete_keys)
+
+
+def versioned_key(prefix, tags, *parts):
+    digest = hashlib.md5(
+        ':'.join((*get_versions(*tags), *map(str, parts))).encode()
+    ).hexdigest()
+    return f'{prefix}:{digest}'
+
+
+def render_post_card(post):
+    comment_count = getattr(post, 'comment_count', post.comments_count)
+    tags = post_tags(post)
+    key = versioned_key(f'blog:post_card:{post.pk}', tags, comment_count)
+    html = cache.get(key)
+    if html is None:
+        started = new_version()
+        html = render_to_string('includes/post_card.html', {'post': post})
+        if not reads_from_replicas() or settled(
+            get_versions(*tags), started
+        ):
+            cache.set(key, html, POST_CARD_CACHE_TIMEOUT)
+    return html
+
+
+PAGE_CACHE_HEADERS = ('Cache-Control', 'ETag', 'Last-Modified')
+
+
+def page_cache_key(request):
+    digest = hashlib.md5(request.get_full_path().encode()).hexdigest()
+    return f'blog:page:{digest}'
+
+
+# Пока ключ жив, команда publish_scheduled сама сбрасывает кеш в момент
+# отложенных публикаций и обрезать срок жизни страниц не нужно.
+SCHEDULER_HEARTBEAT_KEY = 'blog:scheduler:heartbeat'
+
+
+def scheduler_alive():
+    return cache.get(SCHEDULER_HEARTBEAT_KEY) is not None
+
+
+def publication_timeout(timeout):
+    """Срок жизни, обрезанный до ближайшей отложенной публикации."""
+    if scheduler_alive():
+        return timeout
+    now = timezone.now()
+    next_pub_date = Post.objects.filter(
+        is_published=True,
+        pub_date__gt=now
+    ).aggregate(next_pub_date=Min('pub_date'))['next_pub_date']
+    if next_pub_date is None:
+        return timeout
+    return min(timeout, int((next_pub_date - now).total_seconds()))
+
+
+def get_cached_page(key):
+    entry = cache.get(key)
+    if entry is None or get_versions(*entry['tags']) != entry['versions']:
+        return None
+    response = HttpResponse(
+        entry['content'],
+        content_type=entry['content_type'],
+        status=entry['status']
+    )
+    for header, value in entry['headers'].items():
+        response[header] = value
+    return response
+
+
+def set_cached_page(key, response, tags, started):
+    """Кладёт ответ в кеш, если его данные не менялись во время запроса.
+
+    started -- значение new_version() на момент начала обработки запроса.
+    """
+    tags = tuple(dict.fromkeys(tags))
+    versions = get_versions(*tags)
+    if not settled(versions, started):
+        return
+    timeout = publication_timeout(PAGE_CACHE_TIMEOUT)
+    if timeout <= 0:
+        return
+    cache.set(
+        key,
+        {
+            'tags': tags,
+            'versions': versions,
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'status': response.status_code,
+            'headers': {
+                header: response[header]
+                for header in PAGE_CACHE_HEADERS
+                if response.has_header(header)
+            },
+        },
+        timeout
+    )
@@ -0,0 +1,79 @@
+"""Потоковая выгрузка публикаций и комментариев в CSV и JSON Lines."""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+from .models import Comment, Post
+from blogicum.constants import EXPORT_CHUNK_SIZE
+
+EXPORT_FIELDS = {
+    Post: (
+        'id',
+        'title',
+        'pub_date',
+        'author__username',
+        'category__slug',
+        'location__name',
+        'is_published',
+        'comments_count',
+        'created_at',
+    ),
+    Comment: (
+        'id',
+        'post_id',
+        'author__username',
+        'text',
+        'created_at',
+    ),
+}
+
+
+class Echo:
+    """Буфер для csv.writer, который сразу возвращает записанную строку."""
+
+    def write(self, value):
+        return value
+
+
+def iter_rows(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Строки выгрузки без создания объектов моделей, кусками из базы."""
+    fields = EXPORT_FIELDS[queryset.model]
+    return fields, queryset.order_by('pk').values_list(*fields).iterator(
+        chunk_size=chunk_size
+    )
+
+
+def iter_csv(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    fields, rows = iter_rows(queryset, chunk_size)
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def iter_jsonl(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    fields, rows = iter_rows(queryset, chunk_size)
+    for row in rows:
+        yield json.dumps(
+            dict(zip(fields, row)), cls=DjangoJSONEncoder, ensure_ascii=False
+        ) + '\n'
+
+
+FORMATS = {
+    'csv': (iter_csv, 'text/csv; charset=utf-8'),
+    'jsonl': (iter_jsonl, 'application/x-ndjson; charset=utf-8'),
+}
+
+
+def export_response(queryset, export_format):
+    serialize, content_type = FORMATS[export_format]
+    response = StreamingHttpResponse(
+        serialize(queryset), content_type=content_type
+    )
+    response['Content-Disposition'] = (
+        'attachment; filename='
+        f'"{queryset.model._meta.model_name}s.{export_format}"'
+    )
+    return response
@@ -0,0 +1,68 @@
+from django.db import transaction
+from django.db.models import Subquery
+
+from .models import FeedEntry, Post
+from blogicum.constants import FEED_BATCH_SIZE
+
+
+def is_listed(post):
+    """Должна ли публикация быть в ленте (без учёта даты публикации)."""
+    return (
+        post.is_published
+        and post.category_id is not None
+        and post.category.is_published
+    )
+
+
+def entry_fields(post):
+    return {
+        'pub_date': post.pub_date,
+        'title': post.title,
+        'category_id': post.category_id,
+        'author_id': post.author_id,
+    }
+
+
+def sync_post(post, created=False):
+    """Добавляет, обновляет или убирает строку ленты одной публикации.
+
+    Для новой публикации строки заведомо нет: хватает одного INSERT.
+    """
+    entries = FeedEntry.objects.filter(post_id=post.pk)
+    if not is_listed(post):
+        if not created:
+            entries.delete()
+        return
+    fields = entry_fields(post)
+    if created or not entries.update(**fields):
+        # comments_count в памяти мог отстать от базы.
+        FeedEntry.objects.create(
+            post_id=post.pk,
+            comment_count=Subquery(
+                Post.objects.filter(pk=post.pk).values('comments_count')
+            ),
+            **fields
+        )
+
+
+def sync_posts(posts):
+    """Пересобирает строки ленты для набора публикаций пачками."""
+    with transaction.atomic():
+        FeedEntry.objects.filter(post__in=posts.values('pk')).delete()
+        FeedEntry.objects.bulk_create(
+            (
+                FeedEntry(
+                    post_id=post.pk,
+                    comment_count=post.comments_count,
+                    **entry_fields(post)
+                )
+                for post in posts.filter(
+                    is_published=True, category__is_published=True
+                ).iterator(chunk_size=FEED_BATCH_SIZE)
+            ),
+            batch_size=FEED_BATCH_SIZE
+        )
+
+
+def rebuild():
+    sync_posts(Post.objects.all())
@@ -1,17 +1,20 @@
 from django import forms
 from django.core.exceptions import ValidationError
-from django.core.mail import send_mail
 
 from .models import Comment, Post, User
+from .outbox import enqueue
+from .profanity import find_profanity
 from blogicum.constants import (
-    BAD_WORD,
     FORMAT_DATE_TIME,
-    FROM_EMAIL,
     HEIGHT_COMMENT_FORM,
+    MODERATION_EMAILS,
     WIDTH_COMMENT_FORM
 )
 
 
+PROFANITY_ERROR = 'Выражайтесь пожалуйста культурно!!!'
+
+
 class UserForm(forms.ModelForm):
 
     class Meta:
@@ -38,6 +41,12 @@ class CommentForm(forms.ModelForm):
             )
         }
 
+    def clean_text(self):
+        text = self.cleaned_data['text']
+        if find_profanity(text):
+            raise ValidationError(PROFANITY_ERROR)
+        return text
+
 
 class PostForm(forms.ModelForm):
 
@@ -56,15 +65,11 @@ class PostForm(forms.ModelForm):
     def clean(self):
         super().clean()
         text = self.cleaned_data['text']
-        if BAD_WORD in f'{text.lower()}':
-            send_mail(
+        if find_profanity(text):
+            enqueue(
                 subject='Anton creat post',
-                message=f'Имеются не цензурные выражения в тексте "{text}".'
+                body=f'Имеются не цензурные выражения в тексте "{text}".'
                 'Надо проверить!!!',
-                from_email=FROM_EMAIL,
-                recipient_list=['Admin@lst.net'],
-                fail_silently=True,
-            )
-            raise ValidationError(
-                'Выражайтесь пожалуйста культурно!!!'
+                recipient_list=MODERATION_EMAILS,
             )
+            raise ValidationError(PROFANITY_ERROR)
@@ -0,0 +1,83 @@
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+from blogicum.constants import (
+    IMAGE_JPEG_QUALITY, IMAGE_VARIANTS, IMAGE_WEBP_QUALITY
+)
+
+FORMATS = {
+    'jpeg': ('JPEG', {
+        'quality': IMAGE_JPEG_QUALITY, 'optimize': True, 'progressive': True
+    }),
+    'webp': ('WEBP', {'quality': IMAGE_WEBP_QUALITY, 'method': 6}),
+}
+
+
+def variant_name(name, variant, image_format):
+    path = PurePosixPath(name)
+    extension = 'jpg' if image_format == 'jpeg' else image_format
+    return str(
+        path.parent / 'variants' / f'{path.stem}.{variant}.{extension}'
+    )
+
+
+def flatten(image):
+    if image.mode in ('RGBA', 'LA', 'P'):
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, 'white')
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+    return image.convert('RGB')
+
+
+def generate_variants(name, force=False, storage=default_storage):
+    """Создаёт уменьшенные копии изображения рядом с оригиналом.
+
+    Варианты перечислены по возрастанию ширины; варианты шире оригинала,
+    кроме самого маленького, не создаются. Возвращает количество
+    записанных файлов.
+    """
+    written = 0
+    with storage.open(name) as original:
+        image = ImageOps.exif_transpose(Image.open(original))
+        image = flatten(image)
+    for index, (variant, width) in enumerate(IMAGE_VARIANTS.items()):
+        if index and width > image.width:
+            break
+        resized = image.copy()
+        resized.thumbnail((width, width * 4))
+        for image_format, (pil_format, params) in FORMATS.items():
+            target = variant_name(name, variant, image_format)
+            if storage.exists(target):
+                if not force:
+                    continue
+                storage.delete(target)
+            buffer = BytesIO()
+            resized.save(buffer, pil_format, **params)
+            storage.save(target, ContentFile(buffer.getvalue()))
+            written += 1
+    return written
+
+
+def image_variants(image, storage=default_storage):
+    """URL вариантов изображения, которые уже сгенерированы."""
+    if not image:
+        return {}
+    variants = {}
+    for variant, width in IMAGE_VARIANTS.items():
+        if not storage.exists(variant_name(image.name, variant, 'jpeg')):
+            continue
+        variants[variant] = {
+            'width': width,
+            **{
+                image_format: storage.url(
+                    variant_name(image.name, variant, image_format)
+                )
+                for image_format in FORMATS
+            }
+        }
+    return variants
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from blog.transfer import export_objects
+from blogicum.constants import TRANSFER_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = (
+        'Выгружает пользователей, категории, местоположения, публикации '
+        'и комментарии в JSON в формате dumpdata, по одной записи.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            nargs='?',
+            default='-',
+            help='Файл для выгрузки; по умолчанию stdout.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=TRANSFER_BATCH_SIZE,
+            help='Сколько строк читать из базы за раз.'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if path == '-':
+            export_objects(self.stdout, options['chunk_size'])
+            return
+        with open(path, 'w', encoding='utf-8') as stream:
+            stats = export_objects(stream, options['chunk_size'])
+        for label, count in stats.items():
+            self.stdout.write(f'{label}: {count}')
@@ -0,0 +1,57 @@
+from django.core.exceptions import FieldError, ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.exports import FORMATS
+from blog.models import Comment, Post
+from blogicum.constants import EXPORT_CHUNK_SIZE
+
+MODELS = {
+    'posts': Post,
+    'comments': Comment,
+}
+
+
+class Command(BaseCommand):
+    help = 'Выгружает публикации или комментарии в CSV или JSON Lines.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', choices=MODELS)
+        parser.add_argument(
+            '--format', choices=FORMATS, default='csv', dest='export_format'
+        )
+        parser.add_argument(
+            '--output', help='Файл для выгрузки; по умолчанию stdout.'
+        )
+        parser.add_argument(
+            '--filter',
+            action='append',
+            default=[],
+            metavar='LOOKUP=VALUE',
+            help='Условие для filter(), например author__username=admin.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help='Сколько строк читать из базы за раз.'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            lookups = dict(
+                condition.split('=', 1) for condition in options['filter']
+            )
+        except ValueError:
+            raise CommandError('Условие фильтра задаётся как LOOKUP=VALUE.')
+        try:
+            queryset = MODELS[options['model']].objects.filter(**lookups)
+        except (FieldError, ValidationError, ValueError) as error:
+            raise CommandError(f'Некорректный фильтр: {error}')
+        serialize, _ = FORMATS[options['export_format']]
+        lines = serialize(queryset, options['chunk_size'])
+        if not options['output']:
+            for line in lines:
+                self.stdout.write(line, ending='')
+            return
+        with open(options['output'], 'w', encoding='utf-8', newline='') as f:
+            f.writelines(lines)
@@ -0,0 +1,63 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from blog.images import generate_variants
+from blog.models import Post
+
+
+def generate(name, force):
+    try:
+        return name, generate_variants(name, force=force), None
+    except OSError as error:
+        return name, 0, error
+
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        'Создаёт недостающие уменьшенные копии изображений публикаций '
+        'в нескольких процессах.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Количество процессов, по умолчанию по числу ядер.'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Пересоздать уже существующие варианты.'
+        )
+
+    def handle(self, *args, **options):
+        names = Post.objects.exclude(image='').values_list(
+            'image', flat=True
+        ).distinct().order_by().iterator()
+        written = failed = 0
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=options['workers'], initializer=django.setup
+        ) as executor:
+            while batch := list(islice(names, BATCH_SIZE)):
+                for name, count, error in executor.map(
+                    partial(generate, force=options['force']),
+                    batch,
+                    chunksize=16
+                ):
+                    written += count
+                    if error is not None:
+                        failed += 1
+                        self.stderr.write(f'{name}: {error}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Записано файлов: {written}, ошибок: {failed}'
+        ))
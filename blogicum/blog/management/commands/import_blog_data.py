@@ -0,0 +1,48 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from blog.transfer import import_objects, iter_json_array
+from blogicum.constants import TRANSFER_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = (
+        'Загружает пользователей, категории, местоположения, публикации '
+        'и комментарии из JSON в формате dumpdata, не читая файл целиком.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Файл с данными или «-» для stdin.')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=TRANSFER_BATCH_SIZE,
+            help='Сколько записей вставлять одним запросом.'
+        )
+        parser.add_argument(
+            '--ignore-conflicts',
+            action='store_true',
+            help='Пропускать записи, которые уже есть в базе.'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        stream = (
+            sys.stdin if path == '-' else open(path, encoding='utf-8')
+        )
+        try:
+            stats = import_objects(
+                iter_json_array(stream),
+                batch_size=options['batch_size'],
+                ignore_conflicts=options['ignore_conflicts']
+            )
+        except (ValueError, DatabaseError) as error:
+            raise CommandError(f'Загрузка прервана: {error}')
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        for label, count in sorted(stats.items()):
+            self.stdout.write(f'{label}: {count}')
+        self.stdout.write(self.style.SUCCESS('Данные загружены.'))
@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from blog.scheduler import heartbeat, next_pub_date, promote_due
+from blogicum.constants import SCHEDULER_INTERVAL
+
+
+class Command(BaseCommand):
+    help = (
+        'Сбрасывает кеш страниц и карточек, когда наступает время '
+        'отложенных публикаций.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help=(
+                'Работать постоянно, просыпаясь к ближайшей pub_date; '
+                'пока команда работает, страницы кешируются на полный срок.'
+            )
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=SCHEDULER_INTERVAL,
+            help=(
+                'Наибольшая пауза в секундах: так часто замечаются '
+                'новые отложенные публикации.'
+            )
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            promoted = promote_due()
+            if promoted:
+                self.stdout.write(f'Вышло публикаций: {promoted}')
+            if not options['loop']:
+                return
+            heartbeat(2 * options['interval'])
+            time.sleep(self.delay(options['interval']))
+
+    @staticmethod
+    def delay(interval):
+        now = timezone.now()
+        pub_date = next_pub_date(now)
+        if pub_date is None:
+            return interval
+        return min(interval, max((pub_date - now).total_seconds(), 0))
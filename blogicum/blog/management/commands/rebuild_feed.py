@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from blog import feed
+
+
+class Command(BaseCommand):
+    help = 'Перестраивает таблицу ленты FeedEntry по публикациям.'
+
+    def handle(self, *args, **options):
+        feed.rebuild()
+        self.stdout.write(self.style.SUCCESS('Лента перестроена.'))
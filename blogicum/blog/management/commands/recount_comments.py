@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = (
+        'Сверяет сохранённое количество комментариев у публикаций '
+        'с фактическим и исправляет расхождения.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Только показать публикации с расхождением.'
+        )
+
+    def handle(self, *args, **options):
+        drifted = Post.custom_objects.with_drifted_comments_count()
+        if options['dry_run']:
+            for post_id, stored, actual in drifted.values_list(
+                'pk', 'comments_count', 'actual_comments_count'
+            ).iterator():
+                self.stdout.write(f'{post_id}: {stored} -> {actual}')
+            return
+        updated = Post.custom_objects.recount_comments()
+        self.stdout.write(
+            self.style.SUCCESS(f'Исправлено публикаций: {updated}')
+        )
@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog.outbox import deliver_pending
+from blogicum.constants import OUTBOX_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Отправляет письма из очереди исходящих сообщений.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=OUTBOX_BATCH_SIZE,
+            help='Сколько писем забирать за один проход.'
+        )
+        parser.add_argument(
+            '--backend',
+            help=(
+                'Почтовый бэкенд вместо EMAIL_BACKEND, например '
+                'django.core.mail.backends.console.EmailBackend.'
+            )
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Работать постоянно, опрашивая очередь.'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5,
+            help='Пауза в секундах, когда очередь пуста.'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = deliver_pending(
+                options['batch_size'], options['backend']
+            )
+            if sent or failed:
+                self.stdout.write(
+                    f'Отправлено: {sent}, отложено до повтора: {failed}'
+                )
+            if not options['loop']:
+                return
+            if not sent and not failed:
+                time.sleep(options['interval'])
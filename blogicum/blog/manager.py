@@ -1,5 +1,6 @@
 from django.db import models
-from django.db.models import Count
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 
@@ -18,8 +19,84 @@ class PostQuerySet(models.query.QuerySet):
 
     def comment_count(self):
         return self.annotate(
-            comment_count=Count('comments')
+            comment_count=F('comments_count')
         ).order_by(
             '-pub_date',
-            'title'
+            'title',
+            'id'
         )
+
+    def public_feed(self):
+        """Опубликованные посты по таблице ленты FeedEntry.
+
+        Видимость категории и публикации уже учтена при записи в ленту,
+        поэтому остаётся одно условие по дате в индексе ленты.
+        """
+        return self.select_related(
+            'feed_entry',
+            'category',
+            'author',
+            'location',
+        ).filter(
+            feed_entry__pub_date__lte=timezone.now()
+        ).annotate(
+            comment_count=F('feed_entry__comment_count')
+        ).order_by(
+            '-feed_entry__pub_date',
+            'feed_entry__title',
+            'feed_entry__post_id'
+        )
+
+    def _feed_entries(self):
+        feed_entries = self.model._meta.get_field('feed_entry').related_model
+        return feed_entries.objects.filter(post__in=self.values('pk'))
+
+    def change_comments_count(self, delta):
+        self._feed_entries().update(
+            comment_count=F('comment_count') + delta
+        )
+        return self.update(comments_count=F('comments_count') + delta)
+
+    def _actual_comments_count(self):
+        comments = self.model._meta.get_field('comments').related_model
+        return Coalesce(
+            Subquery(
+                comments.objects.filter(
+                    post=OuterRef('pk')
+                ).order_by().values('post').annotate(
+                    total=Count('pk')
+                ).values('total')
+            ),
+            0
+        )
+
+    def with_drifted_comments_count(self):
+        return self.annotate(
+            actual_comments_count=self._actual_comments_count()
+        ).exclude(
+            comments_count=F('actual_comments_count')
+        )
+
+    def recount_comments(self):
+        updated = self.filter(
+            pk__in=self.with_drifted_comments_count().values('pk')
+        ).update(comments_count=self._actual_comments_count())
+        self._feed_entries().exclude(
+            comment_count=F('post__comments_count')
+        ).update(
+            comment_count=Subquery(
+                self.model.objects.filter(
+                    pk=OuterRef('post')
+                ).values('comments_count')
+            )
+        )
+        return updated
+
+
+class OutboxQuerySet(models.query.QuerySet):
+
+    def pending(self, now=None):
+        return self.filter(
+            sent_at__isnull=True,
+            next_attempt_at__lte=now or timezone.now()
+        ).order_by('next_attempt_at', 'id')
@@ -0,0 +1,49 @@
+from django.db import migrations
+
+
+SQLITE_FORWARD = (
+    "CREATE VIRTUAL TABLE blog_post_fts USING fts5("
+    "title, text, tokenize='unicode61 remove_diacritics 2')",
+    "INSERT INTO blog_post_fts (rowid, title, text) "
+    "SELECT id, title, text FROM blog_post",
+)
+SQLITE_BACKWARD = (
+    "DROP TABLE blog_post_fts",
+)
+POSTGRESQL_FORWARD = (
+    "CREATE INDEX blog_post_search_idx ON blog_post USING GIN ("
+    "to_tsvector('russian', "
+    "coalesce(title, '') || ' ' || coalesce(text, '')))",
+)
+POSTGRESQL_BACKWARD = (
+    "DROP INDEX blog_post_search_idx",
+)
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for statement in statements.get(
+            schema_editor.connection.vendor, ()
+        ):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_comment_post_created_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({
+                'sqlite': SQLITE_FORWARD,
+                'postgresql': POSTGRESQL_FORWARD,
+            }),
+            run_for_vendor({
+                'sqlite': SQLITE_BACKWARD,
+                'postgresql': POSTGRESQL_BACKWARD,
+            }),
+        ),
+    ]
@@ -1,15 +1,61 @@
+import hashlib
+from itertools import chain
+
+from django.conf import settings
 from django.contrib.auth.mixins import UserPassesTestMixin
+from django.core.paginator import InvalidPage
+from django.db.models import Max
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404
 from django.urls import reverse
+from django.utils.cache import (
+    get_conditional_response, patch_cache_control, patch_vary_headers
+)
+from django.utils import timezone
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
 
+from .cache import (
+    get_cached_page,
+    get_published_category,
+    get_user,
+    get_versions,
+    new_version,
+    page_cache_key,
+    post_tags,
+    set_cached_page,
+    version_datetime
+)
 from .models import Comment, Post
-from blogicum.constants import COUNT_POSTS_PAGINATE
+from .paginators import CursorPaginator
+from .syndication import FEED_TYPES, build_feed
+from blogicum.constants import (
+    COUNT_COMMENTS_PAGINATE,
+    COUNT_POSTS_PAGINATE,
+    CURSOR_QUERY_PARAM,
+    SYNDICATION_ITEMS
+)
+
+
+class MemoizeMixin:
+    """Запоминает результаты поиска объектов на время запроса."""
+
+    def memoize(self, name, lookup):
+        memo = self.__dict__.setdefault('_memo', {})
+        if name not in memo:
+            memo[name] = lookup()
+        return memo[name]
 
 
-class OnlyAuthorMixin(UserPassesTestMixin):
+class OnlyAuthorMixin(MemoizeMixin, UserPassesTestMixin):
+
+    def get_object(self, queryset=None):
+        return self.memoize(
+            'object', lambda: super(OnlyAuthorMixin, self).get_object(queryset)
+        )
 
     def test_func(self):
         object = self.get_object()
-        return object.author == self.request.user
+        return object.author_id == self.request.user.pk
 
 
 class CommetMixin:
@@ -26,6 +72,20 @@ class CommetMixin:
 
 class PaginateMixin:
     paginate_by = COUNT_POSTS_PAGINATE
+    cursor_paginate = None
+
+    def paginate_queryset(self, queryset, page_size):
+        cursor_paginate = self.cursor_paginate
+        if cursor_paginate is None:
+            cursor_paginate = settings.BLOG_CURSOR_PAGINATION
+        if not cursor_paginate:
+            return super().paginate_queryset(queryset, page_size)
+        paginator = CursorPaginator(queryset, page_size)
+        try:
+            page = paginator.page(self.request.GET.get(CURSOR_QUERY_PARAM))
+        except InvalidPage as error:
+            raise Http404(str(error))
+        return paginator, page, page.object_list, page.has_other_pages()
 
 
 class PostMixin:
@@ -33,6 +93,41 @@ class PostMixin:
     pk_url_kwarg = 'post_id'
 
 
+class VisiblePostMixin(MemoizeMixin):
+    """Публикация из URL, если она видна текущему пользователю."""
+
+    def get_object(self, queryset=None):
+        return self.memoize('post', self._lookup_post)
+
+    def _lookup_post(self):
+        post = get_object_or_404(
+            Post.objects.select_related(
+                'author',
+                'category',
+                'location',
+            ),
+            pk=self.kwargs['post_id']
+        )
+        if not post.is_visible_to(self.request.user):
+            raise Http404('Публикация не найдена.')
+        return post
+
+
+class CommentPaginateMixin:
+    comments_paginate_by = COUNT_COMMENTS_PAGINATE
+
+    def get_comments_page(self, post):
+        paginator = CursorPaginator(
+            post.comments.select_related('author'),
+            self.comments_paginate_by,
+            ordering=('created_at',)
+        )
+        try:
+            return paginator.page(self.request.GET.get(CURSOR_QUERY_PARAM))
+        except InvalidPage as error:
+            raise Http404(str(error))
+
+
 class ReverseMixin:
     def get_success_url(self):
         return reverse(
@@ -43,3 +138,237 @@ class ReverseMixin:
 
 class TemplateMixin:
     template_name = 'blog/create.html'
+
+
+class CacheScopeMixin:
+    cache_scope = ()
+
+    def get_cache_scope(self):
+        return self.cache_scope
+
+
+class AnonymousPageCacheMixin(CacheScopeMixin):
+
+    def get_page_cache_tags(self, context):
+        tags = list(self.get_cache_scope())
+        posts = context.get('page_obj') or ()
+        if 'post' in context:
+            posts = (context['post'],)
+        for post in posts:
+            tags.extend(post_tags(post))
+        return tags
+
+    def dispatch(self, request, *args, **kwargs):
+        if (
+            request.method not in ('GET', 'HEAD')
+            or request.user.is_authenticated
+        ):
+            return super().dispatch(request, *args, **kwargs)
+        key = page_cache_key(request)
+        response = get_cached_page(key)
+        if response is not None:
+            response = get_conditional_response(
+                request,
+                etag=response.get('ETag'),
+                last_modified=parse_http_date_safe(
+                    response.get('Last-Modified')
+                ),
+                response=response
+            )
+        else:
+            started = new_version()
+            response = super().dispatch(request, *args, **kwargs)
+            if request.method == 'GET' and hasattr(
+                response, 'add_post_render_callback'
+            ):
+                response.add_post_render_callback(
+                    lambda response: self._store_page(key, response, started)
+                )
+        patch_vary_headers(response, ('Cookie',))
+        return response
+
+    def _store_page(self, key, response, started):
+        if (
+            response.status_code != 200
+            or response.cookies
+            or self.request.META.get('CSRF_COOKIE_USED')
+        ):
+            return
+        set_cached_page(
+            key,
+            response,
+            self.get_page_cache_tags(response.context_data),
+            started
+        )
+
+
+class ConditionalGetMixin(MemoizeMixin, CacheScopeMixin):
+    """ETag и Last-Modified, посчитанные без рендеринга страницы.
+
+    Страница публикаций выбирается один раз и потом же идёт в контекст
+    шаблона. Новые комментарии меняют версию тега post:<id>, поэтому
+    отдельно их не запрашиваем.
+    """
+
+    cache_control = {'max_age': 0, 'must_revalidate': True}
+
+    def paginate_queryset(self, queryset, page_size):
+        return self.memoize('page', lambda: super(
+            ConditionalGetMixin, self
+        ).paginate_queryset(queryset, page_size))
+
+    def get_conditional_posts(self):
+        queryset = self.get_queryset()
+        _, _, posts, _ = self.paginate_queryset(
+            queryset, self.get_paginate_by(queryset)
+        )
+        return list(posts)
+
+    def get_validators(self):
+        posts = self.get_conditional_posts()
+        versions = get_versions(
+            *self.get_cache_scope(),
+            *chain.from_iterable(post_tags(post) for post in posts)
+        )
+        # Отложенная публикация автора в профиле не должна давать дату из
+        # будущего: иначе до неё все проверки отвечали бы 304.
+        last_modified = min(timezone.now(), max(
+            [version_datetime(version) for version in versions]
+            + [post.pub_date for post in posts]
+            + [post.created_at for post in posts]
+        ))
+        etag = hashlib.md5(':'.join((
+            *versions,
+            str(last_modified.timestamp()),
+            str(self.request.user.pk),
+            self.request.get_full_path(),
+        )).encode()).hexdigest()
+        return quote_etag(etag), last_modified
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return super().dispatch(request, *args, **kwargs)
+        etag, last_modified = self.get_validators()
+        last_modified = int(last_modified.timestamp())
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+            visibility = (
+                'private' if request.user.is_authenticated else 'public'
+            )
+            patch_cache_control(
+                response, **{visibility: True}, **self.cache_control
+            )
+        patch_vary_headers(response, ('Cookie',))
+        return response
+
+
+class CategoryMixin(MemoizeMixin):
+
+    def get_category(self):
+        return self.memoize('category', self._lookup_category)
+
+    def _lookup_category(self):
+        category = get_published_category(self.kwargs['category_slug'])
+        if category is None:
+            raise Http404('Категория не найдена.')
+        return category
+
+
+class ProfileMixin(MemoizeMixin):
+
+    def get_user(self):
+        return self.memoize('user', self._lookup_user)
+
+    def _lookup_user(self):
+        username = self.kwargs['username']
+        if self.request.user.username == username:
+            return self.request.user
+        user = get_user(username)
+        if user is None:
+            raise Http404('Пользователь не найден.')
+        return user
+
+
+class SyndicationMixin(CacheScopeMixin):
+    """Лента RSS, Atom или JSON Feed по get_queryset().
+
+    Тело ленты кешируется под версиями тегов cache_scope. ETag и
+    Last-Modified считаются до выборки публикаций; в них входит и дата
+    последней вышедшей публикации, так что отложенная публикация меняет
+    ETag и без publish_scheduled.
+    """
+
+    feed_title = ''
+    feed_description = ''
+    cache_control = {'public': True, 'max_age': 0, 'must_revalidate': True}
+
+    def get_feed_type(self):
+        feed_type = FEED_TYPES.get(self.kwargs['feed_format'])
+        if feed_type is None:
+            raise Http404('Неизвестный формат ленты.')
+        return feed_type
+
+    def get_feed_title(self):
+        return self.feed_title
+
+    def get_feed_link(self):
+        raise NotImplementedError
+
+    def get_validators(self):
+        versions = get_versions(*self.get_cache_scope())
+        latest = self.get_queryset().aggregate(
+            latest=Max('pub_date')
+        )['latest']
+        last_modified = min(timezone.now(), max(
+            [version_datetime(version) for version in versions]
+            + [latest] * (latest is not None)
+        ))
+        etag = hashlib.md5(':'.join((
+            *versions,
+            str(last_modified.timestamp()),
+            self.request.path,
+        )).encode()).hexdigest()
+        return quote_etag(etag), last_modified
+
+    def get(self, request, *args, **kwargs):
+        feed_type = self.get_feed_type()
+        etag, last_modified = self.get_validators()
+        last_modified = int(last_modified.timestamp())
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = self.get_feed_response(feed_type)
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, **self.cache_control)
+        return response
+
+    def get_feed_response(self, feed_type):
+        # Ссылки в ленте абсолютные, поэтому в ключе и хост.
+        key = 'blog:syndication:' + hashlib.md5(
+            self.request.build_absolute_uri().encode()
+        ).hexdigest()
+        response = get_cached_page(key)
+        if response is None:
+            started = new_version()
+            feed = build_feed(
+                self.request,
+                feed_type,
+                self.get_queryset().order_by(
+                    '-pub_date', 'title', 'id'
+                )[:SYNDICATION_ITEMS],
+                title=self.get_feed_title(),
+                link=self.get_feed_link(),
+                description=self.feed_description
+            )
+            response = HttpResponse(content_type=feed.content_type)
+            feed.write(response, 'utf-8')
+            set_cached_page(key, response, self.get_cache_scope(), started)
+        return response
@@ -1,8 +1,9 @@
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
+from django.utils import timezone
 
-from .manager import PostQuerySet
+from .manager import OutboxQuerySet, PostQuerySet
 from blogicum.constants import LENGHT_STRING, MAX_QUANTITY_SYMBOLS
 from core.models import DateTimeModel, PublishedModel
 
@@ -89,6 +90,11 @@ class Post(DateTimeModel, PublishedModel):
         upload_to='posts_images',
         blank=True
     )
+    comments_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев'
+    )
 
     class Meta:
         verbose_name = 'публикация'
@@ -98,6 +104,27 @@ class Post(DateTimeModel, PublishedModel):
             '-pub_date',
             'title',
         )
+        indexes = (
+            models.Index(
+                fields=('-pub_date', 'title'),
+                include=('category', 'author', 'location'),
+                condition=models.Q(is_published=True),
+                name='post_public_feed_idx',
+            ),
+            models.Index(
+                fields=('category', '-pub_date', 'title'),
+                condition=models.Q(is_published=True),
+                name='post_category_feed_idx',
+            ),
+            models.Index(
+                fields=('author', '-pub_date', 'title'),
+                name='post_author_feed_idx',
+            ),
+            models.Index(
+                fields=('-pub_date', 'title'),
+                name='post_pub_date_idx',
+            ),
+        )
 
     def __str__(self):
         return self.title[:MAX_QUANTITY_SYMBOLS]
@@ -105,6 +132,78 @@ class Post(DateTimeModel, PublishedModel):
     def get_absolute_url(self):
         return reverse('blog:post_detail', kwargs={'post_id': self.pk})
 
+    def is_visible_to(self, user):
+        """То же условие, что и published_post(), плюс доступ автора."""
+        if user.is_authenticated and user.pk == self.author_id:
+            return True
+        return (
+            self.is_published
+            and self.pub_date <= timezone.now()
+            and self.category is not None
+            and self.category.is_published
+        )
+
+
+class FeedEntry(models.Model):
+    """Публикация в общей ленте: копия полей, нужных главной и категориям.
+
+    Строка есть, пока публикация и её категория опубликованы; отложенные
+    записи хранятся заранее и отсекаются условием pub_date <= now.
+    Поддерживается сигналами (blog.feed).
+    """
+
+    post = models.OneToOneField(
+        Post,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='feed_entry',
+        verbose_name='Публикация'
+    )
+    pub_date = models.DateTimeField(
+        verbose_name='Дата и время публикации'
+    )
+    title = models.CharField(
+        max_length=LENGHT_STRING,
+        verbose_name='Заголовок'
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name='feed_entries',
+        verbose_name='Категория'
+    )
+    author = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='feed_entries',
+        verbose_name='Автор публикации'
+    )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Количество комментариев'
+    )
+
+    class Meta:
+        verbose_name = 'запись ленты'
+        verbose_name_plural = 'Лента'
+        ordering = (
+            '-pub_date',
+            'title',
+        )
+        indexes = (
+            models.Index(
+                fields=('-pub_date', 'title', 'post'),
+                name='feed_entry_pub_date_idx',
+            ),
+            models.Index(
+                fields=('category', '-pub_date', 'title', 'post'),
+                name='feed_entry_category_idx',
+            ),
+        )
+
+    def __str__(self):
+        return self.title[:MAX_QUANTITY_SYMBOLS]
+
 
 class Comment(DateTimeModel):
     text = models.TextField(
@@ -126,9 +225,70 @@ class Comment(DateTimeModel):
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
         default_related_name = 'comments'
+        indexes = (
+            models.Index(
+                fields=('post', 'created_at'),
+                name='comment_post_created_idx',
+            ),
+            models.Index(
+                fields=('created_at',),
+                name='comment_created_idx',
+            ),
+        )
 
     def __str__(self):
         return (
             f'{self.post.title} | {self.author} |'
             f' {self.text}'[:MAX_QUANTITY_SYMBOLS]
         )
+
+    def save(self, *args, **kwargs):
+        # Счётчик comments_count меняется в blog.signals в той же
+        # транзакции, что и сам комментарий.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class OutboxMessage(DateTimeModel):
+    recipient = models.EmailField(
+        verbose_name='Получатель'
+    )
+    subject = models.CharField(
+        max_length=LENGHT_STRING,
+        verbose_name='Тема'
+    )
+    body = models.TextField(
+        verbose_name='Текст письма'
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='Попыток отправки'
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='Следующая попытка'
+    )
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Отправлено'
+    )
+    last_error = models.TextField(
+        blank=True,
+        verbose_name='Последняя ошибка'
+    )
+    objects = OutboxQuerySet.as_manager()
+
+    class Meta(DateTimeModel.Meta):
+        verbose_name = 'исходящее письмо'
+        verbose_name_plural = 'Исходящие письма'
+        indexes = (
+            models.Index(
+                fields=('next_attempt_at',),
+                condition=models.Q(sent_at__isnull=True),
+                name='outbox_pending_idx',
+            ),
+        )
+
+    def __str__(self):
+        return f'{self.recipient} | {self.subject}'[:MAX_QUANTITY_SYMBOLS]
@@ -0,0 +1,123 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboxMessage
+from blogicum.constants import (
+    FROM_EMAIL,
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_LEASE_SECONDS,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_RETRY_BASE_SECONDS,
+    OUTBOX_RETRY_MAX_SECONDS
+)
+
+
+def enqueue(subject, body, recipient_list):
+    return OutboxMessage.objects.bulk_create(
+        OutboxMessage(recipient=recipient, subject=subject, body=body)
+        for recipient in recipient_list
+    )
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=min(
+        OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1),
+        OUTBOX_RETRY_MAX_SECONDS
+    ))
+
+
+def claim(batch_size):
+    """Забирает пачку писем в работу, откладывая их на время аренды.
+
+    Если обработчик упадёт, не отметив письма, они снова станут доступны
+    после окончания аренды.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            OutboxMessage.objects.pending(now).filter(
+                attempts__lt=OUTBOX_MAX_ATTEMPTS
+            ).select_for_update(skip_locked=True).values_list(
+                'pk', flat=True
+            )[:batch_size]
+        )
+        OutboxMessage.objects.filter(pk__in=ids).update(
+            next_attempt_at=now + timedelta(seconds=OUTBOX_LEASE_SECONDS)
+        )
+    return list(OutboxMessage.objects.filter(pk__in=ids).order_by('id'))
+
+
+def build_email(recipient, messages):
+    if len(messages) == 1:
+        message, = messages
+        return EmailMessage(
+            message.subject, message.body, FROM_EMAIL, [recipient]
+        )
+    return EmailMessage(
+        f'Сводка модерации: {len(messages)} сообщений',
+        '\n\n'.join(
+            f'{message.subject}\n{message.body}' for message in messages
+        ),
+        FROM_EMAIL,
+        [recipient]
+    )
+
+
+def mark_failed(messages, error):
+    """Откладывает письма до следующей попытки с растущей паузой."""
+    now = timezone.now()
+    for message in messages:
+        OutboxMessage.objects.filter(pk=message.pk).update(
+            attempts=F('attempts') + 1,
+            next_attempt_at=now + retry_delay(message.attempts + 1),
+            last_error=repr(error)
+        )
+
+
+def deliver_pending(batch_size=OUTBOX_BATCH_SIZE, backend=None):
+    """Отправляет пачку писем через одно соединение.
+
+    Несколько писем одному получателю объединяются в одну сводку.
+    Если не удалось даже подключиться, откладывается вся пачка.
+    Возвращает пару (отправлено, отложено) в исходных сообщениях.
+    """
+    by_recipient = defaultdict(list)
+    for message in claim(batch_size):
+        by_recipient[message.recipient].append(message)
+    if not by_recipient:
+        return 0, 0
+    sent = failed = 0
+    connection = get_connection(backend)
+    try:
+        connection.open()
+    except Exception as error:
+        claimed = [
+            message
+            for messages in by_recipient.values()
+            for message in messages
+        ]
+        mark_failed(claimed, error)
+        return 0, len(claimed)
+    try:
+        for recipient, messages in by_recipient.items():
+            ids = [message.pk for message in messages]
+            try:
+                connection.send_messages([build_email(recipient, messages)])
+            except Exception as error:
+                mark_failed(messages, error)
+                failed += len(ids)
+            else:
+                OutboxMessage.objects.filter(pk__in=ids).update(
+                    sent_at=timezone.now(),
+                    attempts=F('attempts') + 1,
+                    last_error=''
+                )
+                sent += len(ids)
+    finally:
+        connection.close()
+    return sent, failed
@@ -0,0 +1,260 @@
+import base64
+import binascii
+import datetime
+import json
+from collections.abc import Sequence
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import InvalidPage, Paginator
+from django.db import DatabaseError, connections
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+from blogicum.constants import CURSOR_QUERY_PARAM, EXACT_COUNT_LIMIT
+
+
+NEXT = 'n'
+PREVIOUS = 'p'
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """Не обрезает микросекунды, иначе курсор попадёт между записями."""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CursorPage(Sequence):
+    """Страница с токенами соседних страниц вместо их номеров."""
+
+    def __init__(self, object_list, paginator, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f'<CursorPage of {len(self)} objects>'
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """Пагинация по ключу сортировки (keyset) вместо OFFSET.
+
+    Страница выбирается условием на значения полей сортировки последнего
+    (или первого) объекта предыдущей страницы, поэтому стоимость запроса
+    не зависит от глубины листания и не требует COUNT(*).
+    """
+
+    cursor_query_param = CURSOR_QUERY_PARAM
+
+    def __init__(self, object_list, per_page, ordering=None):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.model = object_list.model
+        ordering = list(ordering or object_list.query.order_by)
+        if not ordering or not self._is_unique(ordering[-1].lstrip('-')):
+            ordering.append('pk')
+        self.ordering = tuple(
+            (field.lstrip('-'), field.startswith('-')) for field in ordering
+        )
+        self.fields = tuple(
+            self._resolve_field(path) for path, _ in self.ordering
+        )
+
+    def _resolve_path(self, path):
+        model = self.model
+        fields = []
+        for part in path.split('__'):
+            if fields:
+                model = fields[-1].related_model
+            if part == 'pk':
+                part = model._meta.pk.name
+            try:
+                fields.append(model._meta.get_field(part))
+            except FieldDoesNotExist:
+                raise ValueError(
+                    f'Нельзя построить курсор по полю «{path}».'
+                )
+        return fields
+
+    def _resolve_field(self, path):
+        return self._resolve_path(path)[-1]
+
+    def _is_unique(self, path):
+        """Первичный ключ самой модели или связанной один-к-одному."""
+        *relations, field = self._resolve_path(path)
+        return field.primary_key and all(
+            relation.one_to_one for relation in relations
+        )
+
+    @staticmethod
+    def _resolve_value(obj, path):
+        for part in path.split('__'):
+            obj = getattr(obj, part)
+        return obj
+
+    def encode_cursor(self, direction, obj):
+        values = [self._resolve_value(obj, path) for path, _ in self.ordering]
+        payload = json.dumps([direction, values], cls=CursorEncoder)
+        return base64.urlsafe_b64encode(
+            payload.encode()
+        ).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            payload = base64.urlsafe_b64decode(
+                cursor + '=' * (-len(cursor) % 4)
+            )
+            direction, values = json.loads(payload)
+            if (
+                direction not in (NEXT, PREVIOUS)
+                or len(values) != len(self.fields)
+            ):
+                raise ValueError
+            values = [
+                field.to_python(value)
+                for field, value in zip(self.fields, values)
+            ]
+        except (
+            binascii.Error, TypeError, ValueError, ValidationError
+        ):
+            raise InvalidPage('Некорректный курсор страницы.')
+        return direction, values
+
+    def _keyset_filter(self, values, forward):
+        """Условие «строго после ключа» в заданном направлении обхода."""
+        condition = Q()
+        for index, ((path, descending), value) in enumerate(
+            zip(self.ordering, values)
+        ):
+            lookup = 'lt' if descending == forward else 'gt'
+            branch = Q(**{f'{path}__{lookup}': value})
+            for (prev_path, _), prev_value in zip(
+                self.ordering[:index], values
+            ):
+                branch &= Q(**{prev_path: prev_value})
+            condition |= branch
+        return condition
+
+    def _order_by(self, forward):
+        return [
+            f'{"-" if descending == forward else ""}{path}'
+            for path, descending in self.ordering
+        ]
+
+    def page(self, cursor=None):
+        direction, values = (
+            self.decode_cursor(cursor) if cursor else (NEXT, None)
+        )
+        forward = direction == NEXT
+        queryset = self.object_list.order_by(*self._order_by(forward))
+        if values is not None:
+            queryset = queryset.filter(self._keyset_filter(values, forward))
+        object_list = list(queryset[:self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[:self.per_page]
+        if not forward:
+            object_list.reverse()
+        if forward:
+            has_next, has_previous = has_more, values is not None
+        else:
+            has_next, has_previous = True, has_more
+        next_cursor = previous_cursor = None
+        if object_list and has_next:
+            next_cursor = self.encode_cursor(NEXT, object_list[-1])
+        if object_list and has_previous:
+            previous_cursor = self.encode_cursor(PREVIOUS, object_list[0])
+        return CursorPage(object_list, self, next_cursor, previous_cursor)
+
+
+def explain_count(queryset):
+    """Оценка планировщика PostgreSQL для отфильтрованной выборки или None."""
+    if connections[queryset.db].vendor != 'postgresql':
+        return None
+    try:
+        plan = json.loads(queryset.order_by().explain(format='json'))
+    except (DatabaseError, ValueError):
+        return None
+    rows = plan[0]['Plan']['Plan Rows']
+    return rows if rows > 0 else None
+
+
+def estimate_count(queryset):
+    """Оценка числа строк таблицы из статистики базы или None."""
+    connection = connections[queryset.db]
+    table = queryset.model._meta.db_table
+    if connection.vendor == 'postgresql':
+        sql = 'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass'
+    elif connection.vendor == 'sqlite':
+        # Первое число в stat -- количество строк в индексе; заполняется
+        # командой ANALYZE.
+        sql = (
+            'SELECT MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 '
+            'WHERE tbl = %s'
+        )
+    else:
+        return None
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [table])
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    return row[0] if row and row[0] and row[0] > 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator, который не считает COUNT(*) по всей большой таблице.
+
+    До EXACT_COUNT_LIMIT строк считает точно, LIMIT обрывает подсчёт.
+    Дальше берёт оценку из статистики базы: для таблицы без фильтров --
+    число строк таблицы, для отфильтрованной выборки -- оценку
+    планировщика PostgreSQL. Если оценки нет (SQLite), count становится
+    нижней границей (count_is_lower_bound): она сдвигается вслед за
+    запрошенной страницей page_hint, чтобы всегда была ссылка дальше.
+    """
+
+    def __init__(self, *args, page_hint=1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_hint = page_hint
+        self.count_is_lower_bound = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        count = queryset.order_by()[:EXACT_COUNT_LIMIT + 1].count()
+        if count <= EXACT_COUNT_LIMIT:
+            return count
+        estimate = (
+            explain_count(queryset) if queryset.query.has_filters()
+            else estimate_count(queryset)
+        )
+        if estimate:
+            return max(count, estimate)
+        self.count_is_lower_bound = True
+        bottom = (self.page_hint - 1) * self.per_page
+        if bottom + self.per_page < count:
+            return count
+        # Есть ли строки на запрошенной странице и хотя бы одна после неё.
+        ahead = queryset.order_by()[
+            bottom:bottom + self.per_page + 1
+        ].count()
+        return max(count, bottom + ahead)
@@ -1,6 +1,7 @@
 from django.urls import path
 
 from . import views
+from core.async_views import read_view
 
 
 urlpatterns = [
@@ -11,9 +12,14 @@ urlpatterns = [
     ),
     path(
         '<int:post_id>/',
-        views.PostDetailView.as_view(),
+        read_view(views.PostDetailView),
         name='post_detail'
     ),
+    path(
+        '<int:post_id>/comments/',
+        views.PostCommentsView.as_view(),
+        name='post_comments'
+    ),
     path(
         '<int:post_id>/edit/',
         views.PostUpdateView.as_view(),
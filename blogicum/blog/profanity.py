@@ -0,0 +1,158 @@
+import re
+from collections import deque
+from functools import lru_cache
+
+from django.conf import settings
+
+HOMOGLYPHS = str.maketrans({
+    'a': 'а', 'b': 'в', 'c': 'с', 'e': 'е', 'h': 'н', 'k': 'к',
+    'm': 'м', 'o': 'о', 'p': 'р', 't': 'т', 'x': 'х', 'y': 'у',
+    'ё': 'е', '0': 'о', '3': 'з', '4': 'ч', '6': 'б',
+})
+
+
+WORD = re.compile(r'\w+')
+
+
+def normalize(text):
+    return text.lower().translate(HOMOGLYPHS)
+
+
+class AhoCorasick:
+    """Автомат для поиска всех слов словаря за один проход по тексту."""
+
+    def __init__(self, words):
+        self.transitions = [{}]
+        self.fail = [0]
+        self.output = [None]
+        # Слово, которое заканчивается ровно в состоянии, и ближайшее по
+        # цепочке fail такое состояние.
+        self.words = [None]
+        self.suffix = [0]
+        for word in words:
+            self._add(word)
+        self._link()
+
+    def _add(self, word):
+        state = 0
+        for char in word:
+            if char not in self.transitions[state]:
+                self.transitions.append({})
+                self.fail.append(0)
+                self.output.append(None)
+                self.words.append(None)
+                self.suffix.append(0)
+                self.transitions[state][char] = len(self.transitions) - 1
+            state = self.transitions[state][char]
+        if word:
+            self.output[state] = self.words[state] = word
+
+    def _link(self):
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.transitions[state].items():
+                queue.append(child)
+                fail = self.fail[state]
+                while fail and char not in self.transitions[fail]:
+                    fail = self.fail[fail]
+                self.fail[child] = self.transitions[fail].get(char, 0)
+                fail = self.fail[child]
+                self.suffix[child] = (
+                    fail if self.words[fail] else self.suffix[fail]
+                )
+                if self.output[child] is None:
+                    self.output[child] = self.output[self.fail[child]]
+
+    def find(self, text):
+        """Первое слово словаря, встретившееся в тексте, или None."""
+        transitions, fail, output = self.transitions, self.fail, self.output
+        state = 0
+        for char in text:
+            while state and char not in transitions[state]:
+                state = fail[state]
+            state = transitions[state].get(char, 0)
+            if output[state] is not None:
+                return output[state]
+        return None
+
+    def iter_matches(self, text):
+        """Все вхождения слов словаря: пары (конец вхождения, слово)."""
+        transitions, fail, words = self.transitions, self.fail, self.words
+        state = 0
+        for end, char in enumerate(text, start=1):
+            while state and char not in transitions[state]:
+                state = fail[state]
+            state = transitions[state].get(char, 0)
+            match = state if words[state] else self.suffix[state]
+            while match:
+                yield end, words[match]
+                match = self.suffix[match]
+
+
+class Dictionary:
+    """Словарь мата: шаблоны слов и исключения из них.
+
+    Строка словаря -- слово или основа, звёздочка означает любые буквы:
+    «хрен» -- только само слово, «хрен*» -- слова, начинающиеся с основы,
+    «*хрен*» -- основа в любом месте слова. Строка с «!» в начале --
+    исключение в том же формате: слово, подходящее под исключение, не
+    считается бранным (например, «!бляха*» при «бля*»). Строки с «#» --
+    комментарии.
+    """
+
+    def __init__(self, entries):
+        self.patterns = {}
+        self.exclusions = {}
+        for entry in entries:
+            target = self.patterns
+            if entry.startswith('!'):
+                target, entry = self.exclusions, entry[1:]
+            core = entry.strip('*')
+            if core:
+                target.setdefault(core, set()).add(
+                    (not entry.startswith('*'), not entry.endswith('*'))
+                )
+        self.matcher = AhoCorasick(self.patterns)
+        self.exclusion_matcher = AhoCorasick(self.exclusions)
+
+    @staticmethod
+    def _matching(matcher, anchors, word):
+        for end, core in matcher.iter_matches(word):
+            start = end - len(core)
+            for at_start, at_end in anchors[core]:
+                if (not at_start or start == 0) and (
+                    not at_end or end == len(word)
+                ):
+                    yield core
+                    break
+
+    def find(self, text):
+        """Первая основа, найденная в нормализованном тексте, или None."""
+        for word in WORD.findall(text):
+            core = next(
+                self._matching(self.matcher, self.patterns, word), None
+            )
+            if core is not None and next(self._matching(
+                self.exclusion_matcher, self.exclusions, word
+            ), None) is None:
+                return core
+        return None
+
+
+def load_words(path):
+    with open(path, encoding='utf-8') as words:
+        return {
+            normalize(word.strip())
+            for word in words
+            if word.strip() and not word.startswith('#')
+        }
+
+
+@lru_cache(maxsize=None)
+def get_matcher():
+    return Dictionary(load_words(settings.BLOG_BAD_WORDS_FILE))
+
+
+def find_profanity(text):
+    return get_matcher().find(normalize(text))
@@ -0,0 +1,47 @@
+from django.core.cache import cache
+from django.db.models import Min
+from django.utils import timezone
+
+from .cache import SCHEDULER_HEARTBEAT_KEY, bump, post_tags
+from .models import Post
+
+# Граница уже обработанных pub_date; общая для всех процессов, поэтому
+# после перезапуска публикации, наступившие во время простоя, не теряются.
+PROMOTED_UNTIL_KEY = 'blog:scheduler:promoted_until'
+
+
+def next_pub_date(now=None):
+    """Ближайшая отложенная публикация или None."""
+    return Post.objects.filter(
+        is_published=True,
+        pub_date__gt=now or timezone.now()
+    ).aggregate(next_pub_date=Min('pub_date'))['next_pub_date']
+
+
+def promote_due(now=None):
+    """Сбрасывает кеш публикаций, чья pub_date наступила с прошлого прохода.
+
+    Строки ленты FeedEntry заведены заранее и отбираются условием по
+    дате, поэтому меняются только версии тегов. Возвращает число
+    таких публикаций.
+    """
+    now = now or timezone.now()
+    since = cache.get(PROMOTED_UNTIL_KEY)
+    promoted = 0
+    if since is not None:
+        tags = set()
+        for post in Post.objects.filter(
+            is_published=True,
+            pub_date__gt=since,
+            pub_date__lte=now
+        ).only('author', 'category', 'location').iterator():
+            tags.update(post_tags(post))
+            promoted += 1
+        if tags:
+            bump('feed', *tags)
+    cache.set(PROMOTED_UNTIL_KEY, now, None)
+    return promoted
+
+
+def heartbeat(timeout):
+    cache.set(SCHEDULER_HEARTBEAT_KEY, True, timeout)
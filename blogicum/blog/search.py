@@ -0,0 +1,108 @@
+import re
+
+from django.db import connection
+from django.db.models import BooleanField
+from django.db.models.expressions import RawSQL
+
+SEARCH_TABLE = 'blog_post_fts'
+SEARCH_DOCUMENT = (
+    "to_tsvector('russian', "
+    "coalesce(\"blog_post\".\"title\", '') || ' ' || "
+    "coalesce(\"blog_post\".\"text\", ''))"
+)
+SEARCH_QUERY = "plainto_tsquery('russian', %s)"
+
+
+class SQLiteSearchBackend:
+    """Индекс FTS5 с rowid, равным id публикации."""
+
+    @staticmethod
+    def build_query(query):
+        return ' '.join(
+            '"{}"*'.format(word.replace('"', '""'))
+            for word in re.findall(r'\w+', query)
+        )
+
+    def index(self, post):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [post.pk]
+            )
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} (rowid, title, text) '
+                'VALUES (%s, %s, %s)',
+                [post.pk, post.title, post.text]
+            )
+
+    def remove(self, post):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [post.pk]
+            )
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+            cursor.execute(
+                f'INSERT INTO {SEARCH_TABLE} (rowid, title, text) '
+                'SELECT id, title, text FROM blog_post'
+            )
+
+    def search(self, queryset, query):
+        match = self.build_query(query)
+        if not match:
+            return queryset.none()
+        return queryset.filter(
+            pk__in=RawSQL(
+                f'SELECT rowid FROM {SEARCH_TABLE} '
+                f'WHERE {SEARCH_TABLE} MATCH %s',
+                [match]
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f'SELECT rank FROM {SEARCH_TABLE} '
+                f'WHERE {SEARCH_TABLE} MATCH %s '
+                f'AND rowid = "blog_post"."id"',
+                [match]
+            )
+        ).order_by('search_rank', '-pub_date', 'id')
+
+
+class PostgresSearchBackend:
+    """GIN-индекс по выражению to_tsvector обновляется самой СУБД."""
+
+    def index(self, post):
+        pass
+
+    def remove(self, post):
+        pass
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute('REINDEX INDEX blog_post_search_idx')
+
+    def search(self, queryset, query):
+        if not re.search(r'\w', query):
+            return queryset.none()
+        return queryset.annotate(
+            search_match=RawSQL(
+                f'{SEARCH_DOCUMENT} @@ {SEARCH_QUERY}',
+                [query],
+                output_field=BooleanField()
+            ),
+            search_rank=RawSQL(
+                f'ts_rank({SEARCH_DOCUMENT}, {SEARCH_QUERY})', [query]
+            )
+        ).filter(
+            search_match=True
+        ).order_by('-search_rank', '-pub_date', 'id')
+
+
+BACKENDS = {
+    'sqlite': SQLiteSearchBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_search_backend():
+    return BACKENDS[connection.vendor]()
@@ -0,0 +1,178 @@
+import logging
+import threading
+
+from django.db.models.signals import (
+    post_delete, post_init, post_save, pre_delete
+)
+from django.dispatch import receiver
+
+from .cache import bump, category_key, forget, post_tags, user_key
+from .feed import sync_post, sync_posts
+from .images import generate_variants
+from .models import Category, Comment, Location, Post, User
+from .search import get_search_backend
+
+logger = logging.getLogger(__name__)
+
+# Публикации, которые сейчас удаляются вместе с комментариями.
+_deleting = threading.local()
+
+
+@receiver(post_init, sender=Post)
+def remember_post_relations(sender, instance, **kwargs):
+    instance._loaded_relations = (
+        instance.__dict__.get('author_id'),
+        instance.__dict__.get('category_id'),
+    )
+    image = instance.__dict__.get('image')
+    instance._loaded_image = getattr(image, 'name', image)
+
+
+@receiver(post_save, sender=Post)
+def generate_post_image_variants(sender, instance, raw=False, **kwargs):
+    if raw or not instance.image or (
+        instance.image.name == instance._loaded_image
+    ):
+        return
+    try:
+        generate_variants(instance.image.name)
+    except OSError:
+        logger.exception(
+            'Не удалось подготовить варианты изображения %s',
+            instance.image.name
+        )
+    instance._loaded_image = instance.image.name
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post(sender, instance, **kwargs):
+    author_id, category_id = instance._loaded_relations
+    bump(
+        'feed',
+        f'author:{author_id}',
+        f'category:{category_id}',
+        *post_tags(instance)
+    )
+    instance._loaded_relations = (instance.author_id, instance.category_id)
+
+
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, raw=False, **kwargs):
+    if not raw:
+        get_search_backend().index(instance)
+
+
+@receiver(post_save, sender=Post)
+def sync_post_feed(sender, instance, created, raw=False, **kwargs):
+    # Строка ленты удаляемой публикации уходит каскадом.
+    if not raw:
+        sync_post(instance, created)
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post(sender, instance, **kwargs):
+    get_search_backend().remove(instance)
+
+
+@receiver(post_init, sender=Comment)
+def remember_comment_post(sender, instance, **kwargs):
+    instance._loaded_post_id = instance.__dict__.get('post_id')
+
+
+@receiver(post_save, sender=Comment)
+def count_saved_comment(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    loaded_post_id = None if created else instance._loaded_post_id
+    if loaded_post_id == instance.post_id:
+        return
+    if loaded_post_id is not None:
+        Post.custom_objects.filter(
+            pk=loaded_post_id
+        ).change_comments_count(-1)
+        bump(f'post:{loaded_post_id}')
+    Post.custom_objects.filter(
+        pk=instance.post_id
+    ).change_comments_count(1)
+
+
+@receiver(pre_delete, sender=Post)
+def remember_deleting_post(sender, instance, **kwargs):
+    _deleting.posts = {*getattr(_deleting, 'posts', ()), instance.pk}
+
+
+@receiver(post_delete, sender=Post)
+def forget_deleting_post(sender, instance, **kwargs):
+    _deleting.posts.discard(instance.pk)
+
+
+@receiver(post_delete, sender=Comment)
+def count_deleted_comment(sender, instance, **kwargs):
+    # Срабатывает и при каскадном удалении, например вместе с автором;
+    # счётчик удаляемой публикации не трогаем.
+    if instance.post_id in getattr(_deleting, 'posts', ()):
+        return
+    Post.custom_objects.filter(
+        pk=instance.post_id
+    ).change_comments_count(-1)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment(sender, instance, **kwargs):
+    bump(f'post:{instance.post_id}')
+    instance._loaded_post_id = instance.post_id
+
+
+@receiver(post_init, sender=Category)
+def remember_category_state(sender, instance, **kwargs):
+    instance._loaded_slug = instance.__dict__.get('slug')
+    instance._loaded_published = instance.__dict__.get('is_published')
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category(sender, instance, **kwargs):
+    bump('feed', f'category:{instance.pk}')
+    forget(*{
+        category_key(slug) for slug in (instance._loaded_slug, instance.slug)
+    })
+    instance._loaded_slug = instance.slug
+
+
+@receiver(post_save, sender=Category)
+def sync_category_feed(sender, instance, created, raw=False, **kwargs):
+    if not (raw or created) and (
+        instance.is_published != instance._loaded_published
+    ):
+        sync_posts(instance.posts.all())
+    instance._loaded_published = instance.is_published
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_location(sender, instance, **kwargs):
+    bump(f'location:{instance.pk}')
+
+
+@receiver(post_init, sender=User)
+def remember_username(sender, instance, **kwargs):
+    instance._loaded_username = instance.__dict__.get('username')
+
+
+@receiver(post_save, sender=User)
+def invalidate_author(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    bump(f'author:{instance.pk}')
+    forget(*{
+        user_key(username)
+        for username in (instance._loaded_username, instance.username)
+    })
+    instance._loaded_username = instance.username
+
+
+@receiver(post_delete, sender=User)
+def forget_user(sender, instance, **kwargs):
+    forget(user_key(instance.username))
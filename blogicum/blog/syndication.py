@@ -0,0 +1,65 @@
+import json
+
+from django.conf import settings
+from django.utils.feedgenerator import (
+    Atom1Feed, Rss201rev2Feed, SyndicationFeed
+)
+
+
+class JSONFeed(SyndicationFeed):
+    """JSON Feed 1.1 (https://jsonfeed.org/version/1.1)."""
+
+    content_type = 'application/feed+json; charset=utf-8'
+
+    def write(self, outfile, encoding):
+        feed = {
+            'version': 'https://jsonfeed.org/version/1.1',
+            'title': self.feed['title'],
+            'home_page_url': self.feed['link'],
+            'feed_url': self.feed['feed_url'],
+            'description': self.feed['description'],
+            'language': self.feed['language'],
+            'items': [
+                {
+                    'id': item['unique_id'],
+                    'url': item['link'],
+                    'title': item['title'],
+                    'content_text': item['description'],
+                    'date_published': item['pubdate'].isoformat(),
+                    'authors': [{'name': item['author_name']}],
+                    'tags': list(item['categories']),
+                }
+                for item in self.items
+            ],
+        }
+        outfile.write(json.dumps(feed, ensure_ascii=False))
+
+
+FEED_TYPES = {
+    'rss': Rss201rev2Feed,
+    'atom': Atom1Feed,
+    'json': JSONFeed,
+}
+
+
+def build_feed(request, feed_type, posts, title, link, description):
+    """Собирает ленту feed_type из публикаций с абсолютными ссылками."""
+    feed = feed_type(
+        title=title,
+        link=request.build_absolute_uri(link),
+        description=description,
+        language=settings.LANGUAGE_CODE,
+        feed_url=request.build_absolute_uri(),
+    )
+    for post in posts:
+        url = request.build_absolute_uri(post.get_absolute_url())
+        feed.add_item(
+            title=post.title,
+            link=url,
+            description=post.text,
+            unique_id=url,
+            pubdate=post.pub_date,
+            author_name=post.author.get_full_name() or post.author.username,
+            categories=(post.category.title,),
+        )
+    return feed
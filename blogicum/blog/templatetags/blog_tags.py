@@ -0,0 +1,32 @@
+from django import template
+from django.utils.safestring import mark_safe
+
+from blog.cache import render_post_card
+from blog.images import image_variants
+from blogicum.constants import IMAGE_SIZES
+
+
+register = template.Library()
+
+
+@register.simple_tag
+def cached_post_card(post):
+    return mark_safe(render_post_card(post))
+
+
+@register.inclusion_tag('includes/post_picture.html')
+def post_picture(post, lazy=False):
+    return {
+        'post': post,
+        'variants': image_variants(post.image),
+        'sizes': IMAGE_SIZES,
+        'lazy': lazy,
+    }
+
+
+@register.simple_tag(takes_context=True)
+def query_replace(context, **kwargs):
+    query = context['request'].GET.copy()
+    for key, value in kwargs.items():
+        query[key] = value
+    return query.urlencode()
@@ -0,0 +1,175 @@
+"""Потоковые выгрузка и загрузка данных блога в формате dumpdata."""
+import json
+import re
+from collections import Counter
+
+from django.apps import apps
+from django.core import serializers
+from django.core.management.color import no_style
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+
+from . import feed
+from .cache import ALL_TAG, bump
+from .models import Post
+from .search import get_search_backend
+from blogicum.constants import TRANSFER_BATCH_SIZE, TRANSFER_READ_SIZE
+
+# Порядок важен: сначала модели, на которые ссылаются внешние ключи.
+MODELS = (
+    'auth.user',
+    'blog.category',
+    'blog.location',
+    'blog.post',
+    'blog.comment',
+)
+NON_WHITESPACE = re.compile(r'[^ \t\r\n]')
+
+
+class JSONArrayReader:
+    """Читает JSON-массив из потока кусками по read_size символов."""
+
+    def __init__(self, stream, read_size=TRANSFER_READ_SIZE):
+        self.stream = stream
+        self.read_size = read_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.eof = False
+
+    def fill(self):
+        chunk = self.stream.read(self.read_size)
+        self.eof = not chunk
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+
+    def next_char(self):
+        """Первый непробельный символ; позиция остаётся на нём."""
+        while True:
+            match = NON_WHITESPACE.search(self.buffer, self.position)
+            if match:
+                self.position = match.start()
+                return self.buffer[self.position]
+            self.position = len(self.buffer)
+            if self.eof:
+                raise ValueError('Неожиданный конец JSON-массива.')
+            self.fill()
+
+    def take_char(self):
+        char = self.next_char()
+        self.position += 1
+        return char
+
+    def decode(self):
+        self.next_char()
+        while True:
+            try:
+                item, self.position = self.decoder.raw_decode(
+                    self.buffer, self.position
+                )
+                return item
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self.fill()
+
+    def __iter__(self):
+        if self.take_char() != '[':
+            raise ValueError('Ожидался JSON-массив.')
+        if self.next_char() == ']':
+            return
+        while True:
+            yield self.decode()
+            separator = self.take_char()
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f'Неожиданный символ «{separator}».')
+
+
+def iter_json_array(stream, read_size=TRANSFER_READ_SIZE):
+    """Элементы JSON-массива из потока по одному, без чтения файла целиком."""
+    return iter(JSONArrayReader(stream, read_size))
+
+
+def _reset_sequences():
+    statements = connection.ops.sequence_reset_sql(
+        no_style(), [apps.get_model(label) for label in MODELS]
+    )
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def import_objects(
+    records, batch_size=TRANSFER_BATCH_SIZE, ignore_conflicts=False
+):
+    """Загружает записи dumpdata через bulk_create пачками.
+
+    Вся загрузка идёт в одной транзакции: внешние ключи в Django
+    отложенные (DEFERRABLE INITIALLY DEFERRED) и проверяются при коммите,
+    поэтому записи могут идти в любом порядке, а при ошибке в базе не
+    остаётся половины данных. В памяти держится только текущая пачка.
+    Сигналы моделей не вызываются: счётчики комментариев, лента,
+    поисковый индекс и кеш обновляются один раз в конце. Связи многие-ко-многим
+    (группы и права пользователей) не переносятся.
+    """
+    buffers = {label: [] for label in MODELS}
+    stats = Counter()
+    pending = 0
+
+    def flush():
+        for label, instances in buffers.items():
+            if not instances:
+                continue
+            apps.get_model(label)._default_manager.bulk_create(
+                instances, ignore_conflicts=ignore_conflicts
+            )
+            stats[label] += len(instances)
+            instances.clear()
+
+    with transaction.atomic():
+        for record in records:
+            label = str(record.get('model', '')).lower()
+            if label not in buffers:
+                stats['skipped'] += 1
+                continue
+            for deserialized in serializers.deserialize('python', [record]):
+                buffers[label].append(deserialized.object)
+                pending += 1
+            if pending >= batch_size:
+                flush()
+                pending = 0
+        flush()
+        _reset_sequences()
+        Post.custom_objects.recount_comments()
+        feed.rebuild()
+    get_search_backend().rebuild()
+    bump(ALL_TAG)
+    return stats
+
+
+def export_objects(stream, chunk_size=TRANSFER_BATCH_SIZE):
+    """Пишет данные блога в stream в формате dumpdata, по одной записи."""
+    stats = Counter()
+    separator = ''
+    stream.write('[\n')
+    for label in MODELS:
+        model = apps.get_model(label)
+        fields = [
+            field.name for field in model._meta.local_fields
+            if not field.primary_key
+        ]
+        for instance in model._default_manager.order_by('pk').iterator(
+            chunk_size=chunk_size
+        ):
+            record, = serializers.serialize(
+                'python', [instance], fields=fields
+            )
+            stream.write(separator + json.dumps(
+                record, cls=DjangoJSONEncoder, ensure_ascii=False
+            ) + '\n')
+            separator = ','
+            stats[label] += 1
+    stream.write(']\n')
+    return stats
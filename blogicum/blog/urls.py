@@ -1,16 +1,28 @@
 from django.urls import include, path
 
 from . import views
+from core.async_views import read_view
 
 app_name = 'blog'
 
 urlpatterns = [
-    path('', views.PostListView.as_view(), name='index'),
+    path('', read_view(views.PostListView), name='index'),
     path(
         'category/<slug:category_slug>/',
-        views.CatgoryView.as_view(),
+        read_view(views.CatgoryView),
         name='category_posts'
     ),
+    path(
+        'category/<slug:category_slug>/feeds/<str:feed_format>/',
+        read_view(views.CategoryFeedView),
+        name='category_feed'
+    ),
+    path(
+        'feeds/<str:feed_format>/',
+        read_view(views.PostFeedView),
+        name='feed'
+    ),
+    path('search/', views.SearchView.as_view(), name='search'),
     path('posts/', include('blog.posts_urls')),
     path(
         'profile/edit/',
@@ -19,7 +31,12 @@ urlpatterns = [
     ),
     path(
         'profile/<str:username>/',
-        views.ProfileView.as_view(),
+        read_view(views.ProfileView),
         name='profile'
     ),
+    path(
+        'profile/<str:username>/feeds/<str:feed_format>/',
+        read_view(views.ProfileFeedView),
+        name='profile_feed'
+    ),
 ]
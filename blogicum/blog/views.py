@@ -1,20 +1,31 @@
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect
+from django.template.loader import render_to_string
+from django.urls import reverse
 from django.views.generic import (
-    CreateView, DeleteView, DetailView, ListView, UpdateView
+    CreateView, DeleteView, DetailView, ListView, UpdateView, View
 )
 
 from .forms import CommentForm, PostForm, UserForm
 from .mixins import (
+    AnonymousPageCacheMixin,
+    CategoryMixin,
+    CommentPaginateMixin,
     CommetMixin,
+    ConditionalGetMixin,
     OnlyAuthorMixin,
     PaginateMixin,
     PostMixin,
+    ProfileMixin,
     ReverseMixin,
-    TemplateMixin
+    SyndicationMixin,
+    TemplateMixin,
+    VisiblePostMixin
 )
 from .models import Category, Post, User
+from .search import get_search_backend
 
 
 @login_required
@@ -35,6 +46,7 @@ class CommentUpdateView(
     CommetMixin,
     UpdateView
 ):
+    query_budget = 6
     form_class = CommentForm
 
 
@@ -44,15 +56,17 @@ class CommentDeleteView(
     CommetMixin,
     DeleteView
 ):
-    pass
+    query_budget = 8
 
 
-class ProfileView(PaginateMixin, PostMixin, ListView):
+class ProfileView(
+    ConditionalGetMixin, ProfileMixin, PaginateMixin, PostMixin, ListView
+):
+    query_budget = 8
     template_name = 'blog/profile.html'
 
-    def get_user(self):
-        username = self.kwargs['username']
-        return get_object_or_404(User, username=username)
+    def get_cache_scope(self):
+        return (f'author:{self.get_user().pk}',)
 
     def get_queryset(self):
         user = self.get_user()
@@ -76,6 +90,7 @@ class ProfileView(PaginateMixin, PostMixin, ListView):
 
 
 class UserUpdateView(LoginRequiredMixin, ReverseMixin, UpdateView):
+    query_budget = 4
     model = User
     form_class = UserForm
     template_name = 'blog/user.html'
@@ -84,15 +99,22 @@ class UserUpdateView(LoginRequiredMixin, ReverseMixin, UpdateView):
         return self.request.user
 
 
-class PostListView(PaginateMixin, ListView):
+class PostListView(
+    AnonymousPageCacheMixin, ConditionalGetMixin, PaginateMixin, ListView
+):
+    query_budget = 7
+    cache_scope = ('feed',)
     model = Post
     template_name = 'blog/index.html'
-    queryset = Post.custom_objects.comment_count().published_post()
+
+    def get_queryset(self):
+        return Post.custom_objects.public_feed()
 
 
 class PostCreateView(
     LoginRequiredMixin, ReverseMixin, TemplateMixin, CreateView
 ):
+    query_budget = 10
     model = Post
     form_class = PostForm
 
@@ -104,6 +126,7 @@ class PostCreateView(
 class PostUpdateView(
     LoginRequiredMixin, OnlyAuthorMixin, PostMixin, TemplateMixin, UpdateView
 ):
+    query_budget = 11
     form_class = PostForm
 
     def handle_no_permission(self):
@@ -118,6 +141,7 @@ class PostDeleteView(
     TemplateMixin,
     DeleteView
 ):
+    query_budget = 9
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -125,58 +149,159 @@ class PostDeleteView(
         return context
 
 
-class PostDetailView(PostMixin, DetailView):
+class PostDetailView(
+    AnonymousPageCacheMixin,
+    ConditionalGetMixin,
+    VisiblePostMixin,
+    CommentPaginateMixin,
+    PostMixin,
+    DetailView
+):
+    query_budget = 5
     template_name = 'blog/detail.html'
 
-    def get_object(self, queryset=None):
-        if queryset is None:
-            queryset = self.get_queryset()
-
-        post = get_object_or_404(
-            Post.objects.select_related(
-                'author',
-                'category',
-                'location',
-            ),
-            pk=self.kwargs['post_id']
-        )
-        if self.request.user != post.author:
-            return get_object_or_404(
-                Post.custom_objects.published_post(),
-                pk=self.kwargs['post_id']
-            )
-        return post
+    def get_conditional_posts(self):
+        return [self.get_object()]
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = (
-            self.object.comments.select_related('author')
-        )
+        context['comments'] = self.get_comments_page(self.object)
         return context
 
 
-class CatgoryView(PaginateMixin, ListView):
+class PostCommentsView(
+    VisiblePostMixin, CommentPaginateMixin, PostMixin, View
+):
+    """Следующие страницы комментариев: HTML-фрагмент или JSON."""
+
+    query_budget = 4
+    template_name = 'includes/comment_list.html'
+
+    def get(self, request, *args, **kwargs):
+        post = self.get_object()
+        page = self.get_comments_page(post)
+        html = render_to_string(
+            self.template_name,
+            {'post': post, 'comments': page},
+            request=request
+        )
+        if 'application/json' not in request.headers.get('Accept', ''):
+            return HttpResponse(html)
+        return JsonResponse({
+            'html': html,
+            'next_cursor': page.next_cursor,
+            'comments': [
+                {
+                    'id': comment.pk,
+                    'author': comment.author.username,
+                    'text': comment.text,
+                    'created_at': comment.created_at,
+                }
+                for comment in page
+            ],
+        })
+
+
+class CatgoryView(
+    AnonymousPageCacheMixin,
+    ConditionalGetMixin,
+    CategoryMixin,
+    PaginateMixin,
+    ListView
+):
+    query_budget = 8
     model = Category
     template_name = 'blog/category.html'
 
-    def get_category(self):
-        category = self.kwargs['category_slug']
-        return get_object_or_404(
-            Category.objects.filter(
-                is_published=True
-            ),
-            slug=category
+    def get_queryset(self):
+        return Post.custom_objects.public_feed().filter(
+            feed_entry__category=self.get_category()
         )
 
-    def get_queryset(self):
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
         category = self.get_category()
-        return category.posts(
+        context['category'] = category
+        return context
+
+    def get_cache_scope(self):
+        return (f'category:{self.get_category().pk}',)
+
+
+class PostFeedView(SyndicationMixin, View):
+    query_budget = 3
+    cache_scope = ('feed',)
+    feed_title = 'Блогикум'
+    feed_description = 'Новые публикации Блогикума.'
+
+    def get_queryset(self):
+        return Post.custom_objects.published_post()
+
+    def get_feed_link(self):
+        return reverse('blog:index')
+
+
+class CategoryFeedView(SyndicationMixin, CategoryMixin, View):
+    query_budget = 4
+    feed_description = 'Новые публикации в категории.'
+
+    def get_cache_scope(self):
+        return (f'category:{self.get_category().pk}',)
+
+    def get_queryset(self):
+        return self.get_category().posts(
             manager='custom_objects'
-        ).comment_count().published_post()
+        ).published_post()
+
+    def get_feed_title(self):
+        return f'Блогикум: {self.get_category().title}'
+
+    def get_feed_link(self):
+        return reverse(
+            'blog:category_posts',
+            kwargs={'category_slug': self.get_category().slug}
+        )
+
+
+class ProfileFeedView(SyndicationMixin, ProfileMixin, View):
+    query_budget = 4
+    feed_description = 'Новые публикации автора.'
+
+    def get_cache_scope(self):
+        return (f'author:{self.get_user().pk}',)
+
+    def get_queryset(self):
+        return self.get_user().posts(
+            manager='custom_objects'
+        ).published_post()
+
+    def get_feed_title(self):
+        return f'Блогикум: {self.get_user().username}'
+
+    def get_feed_link(self):
+        return reverse(
+            'blog:profile', kwargs={'username': self.get_user().username}
+        )
+
+
+class SearchView(PaginateMixin, ListView):
+    query_budget = 4
+    template_name = 'blog/search.html'
+    cursor_paginate = False
+
+    def get_search_query(self):
+        return self.request.GET.get('q', '').strip()
+
+    def get_queryset(self):
+        query = self.get_search_query()
+        if not query:
+            return Post.objects.none()
+        return get_search_backend().search(
+            Post.custom_objects.comment_count().published_post(), query
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        category = self.get_category()
-        context['category'] = category
+        context['query'] = self.get_search_query()
         return context
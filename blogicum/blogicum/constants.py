@@ -1,8 +1,32 @@
-BAD_WORD = 'хрен'
 COUNT_POSTS_PAGINATE = 10
+COUNT_COMMENTS_PAGINATE = 20
 LENGHT_STRING = 256
 MAX_QUANTITY_SYMBOLS = 40
 FORMAT_DATE_TIME = '%Y-%m-%dT%H:%M:%S'
 FROM_EMAIL = 'post_form@lst.net'
 HEIGHT_COMMENT_FORM = 5
 WIDTH_COMMENT_FORM = 10
+CURSOR_QUERY_PARAM = 'cursor'
+POST_CARD_CACHE_TIMEOUT = 60 * 60 * 24
+PAGE_CACHE_TIMEOUT = 60 * 60
+LOOKUP_CACHE_TIMEOUT = 60 * 60
+MODERATION_EMAILS = ('Admin@lst.net',)
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_LEASE_SECONDS = 5 * 60
+OUTBOX_MAX_ATTEMPTS = 8
+OUTBOX_RETRY_BASE_SECONDS = 60
+OUTBOX_RETRY_MAX_SECONDS = 6 * 60 * 60
+IMAGE_VARIANTS = {'card': 640, 'detail': 1280}
+IMAGE_JPEG_QUALITY = 80
+IMAGE_WEBP_QUALITY = 75
+IMAGE_SIZES = '(max-width: 640px) 100vw, 640px'
+TRANSFER_BATCH_SIZE = 1000
+TRANSFER_READ_SIZE = 64 * 1024
+EXPORT_CHUNK_SIZE = 2000
+EXACT_COUNT_LIMIT = 10000
+SQLITE_BACKUP_PAGES = 1024
+SQLITE_BACKUP_RETRIES = 20
+SQLITE_BACKUP_SLEEP = 0.25
+FEED_BATCH_SIZE = 1000
+SCHEDULER_INTERVAL = 60
+SYNDICATION_ITEMS = 20
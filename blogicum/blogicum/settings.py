@@ -1,15 +1,27 @@
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-SECRET_KEY = 'django-insecure-uhg25m#j91m(yr0i4cymufpukrwpzz2fp2r2qk(zn9t5u__=l1'
 
-DEBUG = True
+def env_list(name, default):
+    value = os.environ.get(name)
+    return default if value is None else [
+        item.strip() for item in value.split(',') if item.strip()
+    ]
 
-ALLOWED_HOSTS = [
+
+SECRET_KEY = os.environ.get(
+    'DJANGO_SECRET_KEY',
+    'django-insecure-uhg25m#j91m(yr0i4cymufpukrwpzz2fp2r2qk(zn9t5u__=l1'
+)
+
+DEBUG = os.environ.get('DJANGO_DEBUG', '1') == '1'
+
+ALLOWED_HOSTS = env_list('DJANGO_ALLOWED_HOSTS', [
     'localhost',
     '127.0.0.1',
-]
+])
 
 INSTALLED_APPS = [
     'django.contrib.admin',
@@ -19,7 +31,6 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
 
-    'debug_toolbar',
     'django_bootstrap5',
 
     'blog.apps.BlogConfig',
@@ -28,16 +39,22 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
+    'core.middleware.QueryBudgetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'debug_toolbar.middleware.DebugToolbarMiddleware',
 ]
 
+if DEBUG:
+    INSTALLED_APPS.append('debug_toolbar')
+    MIDDLEWARE.append('debug_toolbar.middleware.DebugToolbarMiddleware')
+
 INTERNAL_IPS = [
     '127.0.0.1',
 ]
@@ -64,12 +81,92 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'blogicum.wsgi.application'
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# Без DB_ENGINE=postgresql используется SQLite; соединения держатся
+# DB_CONN_MAX_AGE секунд вместо открытия на каждый запрос.
+if os.environ.get('DB_ENGINE') == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('POSTGRES_DB', 'blogicum'),
+            'USER': os.environ.get('POSTGRES_USER', 'blogicum'),
+            'PASSWORD': os.environ.get('POSTGRES_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5432'),
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+        }
+    }
+DATABASES['default']['CONN_MAX_AGE'] = int(
+    os.environ.get('DB_CONN_MAX_AGE', '60')
+)
+
+# Реплики только для чтения (DB_REPLICAS через запятую): для SQLite -- пути
+# к копиям базы, которые обновляет команда sync_replicas, для PostgreSQL --
+# хосты реплик. В тестах реплики смотрят в тестовую основную базу.
+REPLICA_LOCATION = (
+    'HOST' if os.environ.get('DB_ENGINE') == 'postgresql' else 'NAME'
+)
+for number, replica in enumerate(env_list('DB_REPLICAS', []), start=1):
+    DATABASES[f'replica{number}'] = {
+        **DATABASES['default'],
+        REPLICA_LOCATION: replica,
+        'TEST': {'MIRROR': 'default'},
+    }
+REPLICA_DATABASES = [alias for alias in DATABASES if alias != 'default']
+REPLICA_APP_LABELS = ('blog',)
+DATABASE_ROUTERS = ['core.db.PrimaryReplicaRouter']
+# Наибольшее отставание реплик в секундах: столько после записи браузер
+# автора читает с основной базы, а прочитанное с реплик не кешируется.
+REPLICA_MAX_LAG = int(os.environ.get('DB_REPLICA_MAX_LAG', '10'))
+
+# Применяются к каждому новому соединению с SQLite (core.db). WAL не даёт
+# записи блокировать чтение; SQLITE_TUNING=0 оставляет журнал по умолчанию.
+if os.environ.get('SQLITE_TUNING', '1') == '1':
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'busy_timeout': 5000,
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64 * 1024,
+        'temp_store': 'MEMORY',
+    }
+else:
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'DELETE',
     }
+
+# Версии тегов и forget() сбрасывают кеш только там, где выполнилось
+# сохранение. С несколькими процессами сервера нужен общий кеш
+# (CACHE_BACKEND=redis или memcached, адрес в CACHE_LOCATION): с LocMemCache
+# остальные процессы отдают устаревшие страницы до конца срока жизни.
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+    'redis': 'django_redis.cache.RedisCache',
 }
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'locmem')
+if CACHE_BACKEND == 'locmem':
+    CACHES = {
+        'default': {
+            'BACKEND': CACHE_BACKENDS['locmem'],
+            'OPTIONS': {
+                'MAX_ENTRIES': 10000,
+            },
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': CACHE_BACKENDS[CACHE_BACKEND],
+            'LOCATION': os.environ['CACHE_LOCATION'],
+            'KEY_PREFIX': os.environ.get('CACHE_KEY_PREFIX', 'blogicum'),
+        }
+    }
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -115,3 +212,16 @@ EMAIL_FILE_PATH = BASE_DIR / 'sent_emails'
 LOGIN_REDIRECT_URL = 'blog:index'
 
 LOGIN_URL = 'login'
+
+BLOG_CURSOR_PAGINATION = False
+
+# Включается в asgi.py: под WSGI асинхронные представления только мешают.
+BLOG_ASYNC_VIEWS = os.environ.get('BLOG_ASYNC_VIEWS') == '1'
+
+ASYNC_VIEW_THREADS = int(os.environ.get('ASYNC_VIEW_THREADS', '8'))
+
+QUERY_BUDGET_DUPLICATES = 3
+
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+BLOG_BAD_WORDS_FILE = BASE_DIR / 'blog' / 'data' / 'bad_words.txt'
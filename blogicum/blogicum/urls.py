@@ -5,6 +5,8 @@ from django.contrib.auth.forms import UserCreationForm
 from django.views.generic.edit import CreateView
 from django.urls import include, path, reverse_lazy
 
+from core.views import metrics
+
 
 handler404 = 'pages.views.page_not_found'
 handler500 = 'pages.views.error_server'
@@ -21,6 +23,7 @@ urlpatterns = [
     ),
     path('auth/', include('django.contrib.auth.urls')),
     path('admin/', admin.site.urls),
+    path('metrics/', metrics, name='metrics'),
     path('pages/', include('pages.urls', namespace='pages')),
     path('', include('blog.urls', namespace='blog')),
 ]
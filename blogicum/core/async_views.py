@@ -0,0 +1,63 @@
+"""Асинхронные обёртки для синхронных представлений на чтение.
+
+Django 3.2 не умеет асинхронно работать с ORM, поэтому представление
+целиком, вместе с отрисовкой шаблона, выполняется в отдельном
+ограниченном пуле потоков. Цикл событий при этом не занят, и один
+ASGI-процесс держит много медленных клиентов, а число одновременных
+обращений к базе не превышает ASYNC_VIEW_THREADS.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, update_wrapper
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+from .middleware import record_queries
+
+
+@lru_cache(maxsize=None)
+def get_executor():
+    return ThreadPoolExecutor(
+        max_workers=settings.ASYNC_VIEW_THREADS,
+        thread_name_prefix='async-view'
+    )
+
+
+def run_view(view, request, *args, **kwargs):
+    """Вызывает представление и отрисовывает ответ в текущем потоке."""
+    timings = getattr(request, 'timings', {})
+    close_old_connections()
+    try:
+        with record_queries(*getattr(request, 'query_recorders', ())):
+            started = time.perf_counter()
+            response = view(request, *args, **kwargs)
+            render_started = time.perf_counter()
+            timings['view'] = render_started - started
+            if hasattr(response, 'render') and callable(response.render):
+                response.render()
+                timings['render'] = time.perf_counter() - render_started
+    finally:
+        close_old_connections()
+    return response
+
+
+def as_async_view(view_class, **initkwargs):
+    """Асинхронный аналог view_class.as_view()."""
+    view = view_class.as_view(**initkwargs)
+
+    async def async_view(request, *args, **kwargs):
+        return await sync_to_async(
+            run_view, thread_sensitive=False, executor=get_executor()
+        )(view, request, *args, **kwargs)
+
+    update_wrapper(async_view, view)
+    return async_view
+
+
+def read_view(view_class, **initkwargs):
+    """as_view() или as_async_view() в зависимости от BLOG_ASYNC_VIEWS."""
+    if settings.BLOG_ASYNC_VIEWS:
+        return as_async_view(view_class, **initkwargs)
+    return view_class.as_view(**initkwargs)
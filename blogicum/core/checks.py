@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register(deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """Инвалидация кеша блога верна только для общего для всех процессов."""
+    if settings.CACHES['default']['BACKEND'] not in LOCAL_CACHES:
+        return []
+    return [Warning(
+        'Кеш по умолчанию локален для процесса: после изменений другие '
+        'процессы сервера отдают устаревшие страницы.',
+        hint='Задайте CACHE_BACKEND=redis или memcached и CACHE_LOCATION.',
+        id='core.W001',
+    )]
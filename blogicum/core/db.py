@@ -0,0 +1,103 @@
+import random
+import sqlite3
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+from blogicum.constants import (
+    SQLITE_BACKUP_PAGES, SQLITE_BACKUP_RETRIES, SQLITE_BACKUP_SLEEP
+)
+
+# Включается ReplicaRoutingMiddleware только на время безопасных запросов;
+# команды, фоновые задачи и записи всегда читают с основной базы.
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Настраивает новое соединение с SQLite по SQLITE_PRAGMAS.
+
+    Выполняется напрямую через sqlite3, чтобы PRAGMA не попадали в
+    учёт запросов и бюджеты представлений.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    for name, value in settings.SQLITE_PRAGMAS.items():
+        connection.connection.execute(f'PRAGMA {name} = {value}')
+
+
+@contextmanager
+def replica_reads(enabled=True):
+    """Разрешает чтение с реплик внутри блока.
+
+    Значение хранится в ContextVar, поэтому переходит и в поток
+    асинхронного представления (sync_to_async копирует контекст).
+    """
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def reads_from_replicas():
+    """Может ли текущий запрос прочитать данные с отстающей реплики."""
+    return bool(_replica_reads.get() and settings.REPLICA_DATABASES)
+
+
+class PrimaryReplicaRouter:
+    """Чтение моделей REPLICA_APP_LABELS с реплик, остальное -- с основной.
+
+    Реплика выбирается случайно для каждого запроса к базе. Пока
+    replica_reads() не включён, роутер ничего не меняет.
+    """
+
+    def db_for_read(self, model, **hints):
+        if (
+            reads_from_replicas()
+            and model._meta.app_label in settings.REPLICA_APP_LABELS
+        ):
+            return random.choice(settings.REPLICA_DATABASES)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # На основной базе и репликах одни и те же данные.
+        return True
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+def copy_sqlite(connection, path):
+    """Копирует базу SQLite соединения в файл path через backup API.
+
+    Пока исходная база заблокирована, sqlite3 повторяет шаг бесконечно;
+    после SQLITE_BACKUP_RETRIES таких повторов копирование прерывается
+    ошибкой sqlite3.OperationalError.
+    """
+    retries = 0
+
+    def progress(status, remaining, total):
+        nonlocal retries
+        if status in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED):
+            retries += 1
+            if retries > SQLITE_BACKUP_RETRIES:
+                raise sqlite3.OperationalError(
+                    'База занята, копирование реплики прервано.'
+                )
+
+    connection.ensure_connection()
+    target = sqlite3.connect(path)
+    try:
+        connection.connection.backup(
+            target,
+            pages=SQLITE_BACKUP_PAGES,
+            progress=progress,
+            sleep=SQLITE_BACKUP_SLEEP
+        )
+    finally:
+        target.close()
@@ -0,0 +1,56 @@
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from core.db import copy_sqlite
+
+
+class Command(BaseCommand):
+    help = (
+        'Копирует основную базу SQLite в реплики из DB_REPLICAS; '
+        'заменяет репликацию при локальной разработке.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Копировать постоянно, имитируя отставание реплик.'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2,
+            help='Пауза в секундах между копированиями.'
+        )
+
+    def handle(self, *args, **options):
+        primary = connections[DEFAULT_DB_ALIAS]
+        if primary.vendor != 'sqlite':
+            raise CommandError(
+                'Реплики PostgreSQL синхронизирует сама СУБД.'
+            )
+        if not settings.REPLICA_DATABASES:
+            raise CommandError('Реплики не настроены: задайте DB_REPLICAS.')
+        while True:
+            try:
+                self.sync(primary)
+            except sqlite3.OperationalError as error:
+                if not options['loop']:
+                    raise CommandError(error)
+                self.stderr.write(str(error))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
+
+    def sync(self, primary):
+        started = time.perf_counter()
+        for alias in settings.REPLICA_DATABASES:
+            copy_sqlite(primary, connections[alias].settings_dict['NAME'])
+        self.stdout.write(
+            f'Реплик обновлено: {len(settings.REPLICA_DATABASES)} за '
+            f'{time.perf_counter() - started:.2f} с'
+        )
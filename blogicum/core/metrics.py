@@ -0,0 +1,90 @@
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10
+)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    """Гистограмма в формате Prometheus с меткой view."""
+
+    def __init__(self, name, description, buckets):
+        self.name = name
+        self.description = description
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.series = defaultdict(
+            lambda: {'counts': [0] * len(buckets), 'sum': 0, 'count': 0}
+        )
+
+    def observe(self, view, value):
+        with self.lock:
+            series = self.series[view]
+            index = bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                series['counts'][index] += 1
+            series['sum'] += value
+            series['count'] += 1
+
+    def render(self):
+        lines = [
+            f'# HELP {self.name} {self.description}',
+            f'# TYPE {self.name} histogram',
+        ]
+        with self.lock:
+            for view, series in sorted(self.series.items()):
+                total = 0
+                for bound, count in zip(self.buckets, series['counts']):
+                    total += count
+                    lines.append(
+                        f'{self.name}_bucket{{view="{view}",le="{bound}"}}'
+                        f' {total}'
+                    )
+                lines.extend((
+                    f'{self.name}_bucket{{view="{view}",le="+Inf"}}'
+                    f' {series["count"]}',
+                    f'{self.name}_sum{{view="{view}"}} {series["sum"]}',
+                    f'{self.name}_count{{view="{view}"}} {series["count"]}',
+                ))
+        return lines
+
+
+REQUEST_DURATION = Histogram(
+    'blogicum_request_duration_seconds',
+    'Время обработки запроса.',
+    DURATION_BUCKETS
+)
+VIEW_DURATION = Histogram(
+    'blogicum_view_duration_seconds',
+    'Время работы представления без отрисовки шаблона.',
+    DURATION_BUCKETS
+)
+TEMPLATE_DURATION = Histogram(
+    'blogicum_template_duration_seconds',
+    'Время отрисовки шаблона ответа.',
+    DURATION_BUCKETS
+)
+DB_DURATION = Histogram(
+    'blogicum_db_duration_seconds',
+    'Суммарное время запросов к базе данных.',
+    DURATION_BUCKETS
+)
+DB_QUERIES = Histogram(
+    'blogicum_db_queries',
+    'Число запросов к базе данных.',
+    COUNT_BUCKETS
+)
+HISTOGRAMS = (
+    REQUEST_DURATION, VIEW_DURATION, TEMPLATE_DURATION, DB_DURATION, DB_QUERIES
+)
+
+
+def render_metrics():
+    """Все гистограммы процесса в текстовом формате Prometheus."""
+    lines = []
+    for histogram in HISTOGRAMS:
+        lines.extend(histogram.render())
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.urls import reverse
+
+from . import metrics
+from .db import replica_reads
+from .signals import query_budget_exceeded
+
+logger = logging.getLogger(__name__)
+
+REPLICA_PIN_COOKIE = 'read_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+PLACEHOLDERS = re.compile(r'\((?:%s, )*%s\)')
+SAVEPOINT = re.compile(r'^(?:RELEASE |ROLLBACK TO )?SAVEPOINT ')
+
+
+def query_shape(sql):
+    """Запрос без разницы в длине списков IN (...)."""
+    return PLACEHOLDERS.sub('(...)', sql)
+
+
+def record_queries(*recorders):
+    """Подключает recorders ко всем соединениям с базой текущего потока."""
+    stack = ExitStack()
+    for connection in connections.all():
+        for recorder in recorders:
+            stack.enter_context(connection.execute_wrapper(recorder))
+    return stack
+
+
+class QueryRecorder:
+    """Обёртка execute_wrapper(), запоминающая SQL и время запросов."""
+
+    def __init__(self):
+        self.queries = []
+        self.duration = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        if SAVEPOINT.match(sql):
+            return execute(sql, params, many, context)
+        self.queries.append(sql)
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+
+    def duplicates(self, threshold):
+        """Одинаковые по форме запросы, повторённые threshold раз и более."""
+        return {
+            shape: count
+            for shape, count in Counter(map(query_shape, self.queries)).items()
+            if count >= threshold
+        }
+
+
+class RecordingMiddleware:
+    """Основа middleware, которым нужны запросы к базе за время запроса.
+
+    Регистратор запросов кладётся и в request.query_recorders: в
+    асинхронном режиме представление работает в другом потоке со своим
+    соединением, и core.async_views подключает регистраторы там.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        recorder = self.start(request)
+        with record_queries(recorder):
+            response = self.get_response(request)
+        return self.finish(request, response, recorder, started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        recorder = self.start(request)
+        response = await self.get_response(request)
+        return self.finish(request, response, recorder, started)
+
+    def start(self, request):
+        recorder = QueryRecorder()
+        request.query_recorders = [
+            *getattr(request, 'query_recorders', ()), recorder
+        ]
+        return recorder
+
+    def finish(self, request, response, recorder, started):
+        return response
+
+
+class QueryBudgetMiddleware(RecordingMiddleware):
+    """Следит за числом запросов к базе и повторяющимися запросами (N+1).
+
+    Бюджет задаётся атрибутом query_budget у класса представления.
+    Нарушения пишутся в лог и рассылаются сигналом query_budget_exceeded.
+    """
+
+    def finish(self, request, response, recorder, started):
+        self.check(request, recorder)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget_view = getattr(
+            view_func, 'view_class', view_func
+        )
+
+    def check(self, request, recorder):
+        view = getattr(request, 'query_budget_view', None)
+        if view is None:
+            return
+        budget = getattr(view, 'query_budget', None)
+        duplicates = recorder.duplicates(settings.QUERY_BUDGET_DUPLICATES)
+        if not duplicates and (
+            budget is None or len(recorder.queries) <= budget
+        ):
+            return
+        logger.warning(
+            '%s %s: %d запросов при бюджете %s, повторы: %s',
+            request.method,
+            request.path,
+            len(recorder.queries),
+            budget,
+            duplicates or 'нет'
+        )
+        query_budget_exceeded.send(
+            sender=view,
+            request=request,
+            queries=recorder.queries,
+            budget=budget,
+            duplicates=duplicates
+        )
+
+
+class InstrumentationMiddleware(RecordingMiddleware):
+    """Замеряет время запроса, представления, шаблона и базы данных.
+
+    Замеры отдаются в заголовке Server-Timing и копятся в гистограммах
+    core.metrics по имени представления (blog:index, blog:post_detail...).
+    """
+
+    def start(self, request):
+        request.timings = {}
+        return super().start(request)
+
+    def finish(self, request, response, recorder, started):
+        finished = time.perf_counter()
+        timings = request.timings
+        if 'view_started' in timings:
+            timings.setdefault('view', finished - timings['view_started'])
+        view_name = getattr(
+            request.resolver_match, 'view_name', None
+        ) or 'unresolved'
+        total = finished - started
+        view = timings.get('view', 0)
+        render = timings.get('render', 0)
+        metrics.REQUEST_DURATION.observe(view_name, total)
+        metrics.VIEW_DURATION.observe(view_name, view)
+        metrics.TEMPLATE_DURATION.observe(view_name, render)
+        metrics.DB_DURATION.observe(view_name, recorder.duration)
+        metrics.DB_QUERIES.observe(view_name, len(recorder.queries))
+        response['Server-Timing'] = ', '.join((
+            f'db;dur={recorder.duration * 1000:.1f};'
+            f'desc="{len(recorder.queries)} queries"',
+            f'view;dur={view * 1000:.1f}',
+            f'render;dur={render * 1000:.1f}',
+            f'total;dur={total * 1000:.1f}',
+        ))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.timings['view_started'] = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        if response.is_rendered:
+            # Асинхронное представление уже отрисовало шаблон и записало
+            # замеры в своём потоке.
+            return response
+        timings = request.timings
+        render_started = time.perf_counter()
+        timings['view'] = render_started - timings['view_started']
+
+        def rendered(response):
+            timings['render'] = time.perf_counter() - render_started
+
+        response.add_post_render_callback(rendered)
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """Пускает на реплики только безопасные запросы вне админки.
+
+    После записи браузер получает cookie на REPLICA_MAX_LAG секунд, и
+    пока она жива, его запросы читают с основной базы: автор сразу видит
+    свою публикацию или комментарий, даже если реплика отстаёт.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        with replica_reads(self.use_replicas(request)):
+            response = self.get_response(request)
+        return self.finish(request, response)
+
+    async def __acall__(self, request):
+        with replica_reads(self.use_replicas(request)):
+            response = await self.get_response(request)
+        return self.finish(request, response)
+
+    @staticmethod
+    def use_replicas(request):
+        return bool(
+            settings.REPLICA_DATABASES
+            and request.method in SAFE_METHODS
+            and REPLICA_PIN_COOKIE not in request.COOKIES
+            and not request.path.startswith(reverse('admin:index'))
+        )
+
+    @staticmethod
+    def finish(request, response):
+        if settings.REPLICA_DATABASES and request.method not in SAFE_METHODS:
+            response.set_cookie(
+                REPLICA_PIN_COOKIE,
+                '1',
+                max_age=settings.REPLICA_MAX_LAG,
+                httponly=True,
+                samesite='Lax'
+            )
+        return response
@@ -0,0 +1,4 @@
+from django.dispatch import Signal
+
+# Аргументы: request, queries, budget, duplicates.
+query_budget_exceeded = Signal()
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+
+from .metrics import render_metrics
+
+
+def metrics(request):
+    """Гистограммы для Prometheus: сотрудникам или по METRICS_TOKEN."""
+    token = settings.METRICS_TOKEN
+    if not request.user.is_staff and not (
+        token and constant_time_compare(
+            request.headers.get('Authorization', ''), f'Bearer {token}'
+        )
+    ):
+        raise PermissionDenied
+    return HttpResponse(
+        render_metrics(), content_type='text/plain; version=0.0.4'
+    )
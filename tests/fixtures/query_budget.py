@@ -0,0 +1,36 @@
+import pytest
+
+from core.signals import query_budget_exceeded
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers',
+        'allow_query_budget: не проверять бюджет запросов в тесте'
+    )
+
+
+@pytest.fixture(autouse=True)
+def query_budget(request):
+    """Роняет тест, если запрос превысил бюджет или содержит N+1."""
+    violations = []
+
+    def collect(sender, request, queries, budget, duplicates, **kwargs):
+        message = (
+            f'{request.method} {request.path} ({sender.__qualname__}):'
+            f' {len(queries)} запросов при бюджете {budget}.'
+        )
+        for shape, count in duplicates.items():
+            message += f'\n  {count} раз: {shape}'
+        violations.append(message)
+
+    query_budget_exceeded.connect(collect, dispatch_uid='pytest_query_budget')
+    yield violations
+    query_budget_exceeded.disconnect(dispatch_uid='pytest_query_budget')
+    if violations and not request.node.get_closest_marker(
+        'allow_query_budget'
+    ):
+        pytest.fail(
+            'Превышен бюджет запросов к базе данных:\n'
+            + '\n'.join(violations)
+        )
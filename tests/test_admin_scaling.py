@@ -0,0 +1,84 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blog import paginators
+from blog.admin import PostAdmin
+from blog.models import Post
+
+pytestmark = [pytest.mark.django_db]
+
+CHANGELISTS = ('/admin/blog/post/', '/admin/blog/comment/')
+
+
+def _count_queries(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    return len(queries)
+
+
+@pytest.mark.parametrize('url', CHANGELISTS)
+def test_changelist_queries_do_not_grow_with_rows(admin_client, mixer, url):
+    def add_rows(count):
+        for post in mixer.cycle(count).blend('blog.Post'):
+            mixer.blend('blog.Comment', post=post)
+
+    add_rows(2)
+    few = _count_queries(admin_client, url)
+    add_rows(20)
+    many = _count_queries(admin_client, url)
+    assert many == few, (
+        f'Убедитесь, что число запросов на странице {url} админки'
+        ' не зависит от числа строк.'
+    )
+    assert many <= 8, (
+        f'Убедитесь, что страница {url} админки укладывается в бюджет'
+        ' запросов.'
+    )
+
+
+def test_estimated_count_paginator(monkeypatch, mixer):
+    mixer.cycle(5).blend('blog.Post')
+    monkeypatch.setattr(paginators, 'EXACT_COUNT_LIMIT', 2)
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    paginator = paginators.EstimatedCountPaginator(
+        Post.objects.order_by('pk'), 2
+    )
+    assert paginator.count == 5, (
+        'Убедитесь, что для больших таблиц используется оценка числа строк'
+        ' из статистики базы.'
+    )
+    filtered = paginators.EstimatedCountPaginator(
+        Post.objects.filter(pk__gt=0).order_by('pk'), 2
+    )
+    assert filtered.count == 3, (
+        'Убедитесь, что для отфильтрованной выборки подсчёт ограничен.'
+    )
+
+
+def test_capped_count_pages_forward(monkeypatch, admin_client, mixer):
+    mixer.cycle(5).blend('blog.Post', is_published=True)
+    monkeypatch.setattr(paginators, 'EXACT_COUNT_LIMIT', 2)
+    queryset = Post.objects.filter(is_published=True).order_by('pk')
+    last_known = paginators.EstimatedCountPaginator(
+        queryset, 2, page_hint=2
+    )
+    assert last_known.count == 5 and last_known.count_is_lower_bound, (
+        'Убедитесь, что ограниченный подсчёт сдвигается вслед за'
+        ' запрошенной страницей, чтобы можно было листать дальше.'
+    )
+    assert len(last_known.page(3)) == 1
+
+    monkeypatch.setattr(PostAdmin, 'list_per_page', 2)
+    response = admin_client.get(
+        '/admin/blog/post/', {'is_published__exact': 1, 'p': 2}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert 'не менее 5' in response.content.decode('utf-8'), (
+        'Убедитесь, что админка показывает, что число найденных записей'
+        ' -- нижняя граница.'
+    )
@@ -0,0 +1,71 @@
+import importlib
+import threading
+from http import HTTPStatus
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import clear_url_caches
+
+from blog.views import PostListView
+
+pytestmark = [pytest.mark.django_db(transaction=True)]
+
+URLCONFS = ('blog.urls', 'blog.posts_urls', 'blogicum.urls')
+
+
+async def _get(client, url):
+    return await client.get(url)
+
+
+def _reload_urls():
+    for name in URLCONFS:
+        importlib.reload(importlib.import_module(name))
+    clear_url_caches()
+
+
+@pytest.fixture
+def async_views(settings):
+    settings.BLOG_ASYNC_VIEWS = True
+    _reload_urls()
+    yield
+    settings.BLOG_ASYNC_VIEWS = False
+    _reload_urls()
+
+
+def test_async_read_views(
+        async_views, monkeypatch, post_with_published_location
+):
+    post = post_with_published_location
+    threads = []
+    get_queryset = PostListView.get_queryset
+
+    def spy(self):
+        threads.append(threading.current_thread().name)
+        return get_queryset(self)
+
+    monkeypatch.setattr(PostListView, 'get_queryset', spy)
+    client = AsyncClient()
+    response = async_to_sync(_get)(client, '/')
+    assert response.status_code == HTTPStatus.OK
+    assert post.title in response.content.decode('utf-8')
+    assert threads and all(
+        name.startswith('async-view') for name in threads
+    ), (
+        'Убедитесь, что под ASGI представления на чтение выполняются'
+        ' в отдельном пуле потоков.'
+    )
+    assert 'render;dur=' in response['Server-Timing']
+
+    for url in (
+        f'/category/{post.category.slug}/',
+        f'/profile/{post.author.username}/',
+        f'/posts/{post.id}/',
+    ):
+        response = async_to_sync(_get)(client, url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Убедитесь, что страница {url} работает под ASGI.'
+        )
+    assert async_to_sync(_get)(client, '/posts/0/').status_code == (
+        HTTPStatus.NOT_FOUND
+    )
@@ -0,0 +1,79 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from blogicum.constants import COUNT_COMMENTS_PAGINATE
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def many_comments(mixer, post_with_published_location):
+    return mixer.cycle(COUNT_COMMENTS_PAGINATE * 2 + 1).blend(
+        'blog.Comment', post=post_with_published_location
+    )
+
+
+def test_detail_shows_first_comment_page(
+        user_client, post_with_published_location, many_comments
+):
+    post = post_with_published_location
+    response = user_client.get(f'/posts/{post.id}/')
+    comments = response.context['comments']
+    assert [comment.id for comment in comments] == [
+        comment.id for comment in many_comments[:COUNT_COMMENTS_PAGINATE]
+    ], (
+        'Убедитесь, что на странице публикации выводится только первая'
+        ' страница комментариев в порядке их добавления.'
+    )
+    assert f'/posts/{post.id}/comments/?cursor=' in (
+        response.content.decode('utf-8')
+    ), 'Убедитесь, что на странице публикации есть ссылка на продолжение.'
+
+
+def test_comment_pages_endpoint(
+        user_client, post_with_published_location, many_comments
+):
+    post = post_with_published_location
+    cursor = user_client.get(
+        f'/posts/{post.id}/'
+    ).context['comments'].next_cursor
+    seen = []
+    while cursor:
+        with CaptureQueriesContext(connection) as queries:
+            response = user_client.get(
+                f'/posts/{post.id}/comments/',
+                {'cursor': cursor},
+                HTTP_ACCEPT='application/json'
+            )
+        assert response.status_code == HTTPStatus.OK
+        assert len(queries) <= 4, (
+            'Убедитесь, что страница комментариев загружается'
+            ' постоянным числом запросов.'
+        )
+        data = response.json()
+        seen.extend(comment['id'] for comment in data['comments'])
+        cursor = data['next_cursor']
+    assert seen == [
+        comment.id for comment in many_comments[COUNT_COMMENTS_PAGINATE:]
+    ], 'Убедитесь, что страницы комментариев не теряют и не повторяют записи.'
+
+    response = user_client.get(
+        f'/posts/{post.id}/comments/', {'cursor': 'not-a-cursor'}
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_comment_pages_respect_visibility(
+        another_user_client, post_with_published_location
+):
+    post = post_with_published_location
+    post.is_published = False
+    post.save()
+    response = another_user_client.get(f'/posts/{post.id}/comments/')
+    assert response.status_code == HTTPStatus.NOT_FOUND, (
+        'Убедитесь, что комментарии к скрытой публикации недоступны'
+        ' другим пользователям.'
+    )
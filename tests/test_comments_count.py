@@ -0,0 +1,80 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from blog.models import Comment, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _stored_count(post):
+    return Post.objects.values_list(
+        'comments_count', flat=True
+    ).get(pk=post.pk)
+
+
+def test_comments_count_follows_views(
+        user_client, post_with_published_location
+):
+    post = post_with_published_location
+    for text in ('Первый', 'Второй'):
+        user_client.post(f'/posts/{post.id}/comment/', {'text': text})
+    assert _stored_count(post) == 2, (
+        'Убедитесь, что добавление комментария увеличивает счётчик'
+        ' комментариев публикации.'
+    )
+
+    comment = post.comments.first()
+    user_client.post(f'/posts/{post.id}/delete_comment/{comment.id}/')
+    assert _stored_count(post) == 1, (
+        'Убедитесь, что удаление комментария уменьшает счётчик'
+        ' комментариев публикации.'
+    )
+
+    Comment.objects.filter(post=post).delete()
+    assert _stored_count(post) == 0, (
+        'Убедитесь, что массовое удаление комментариев уменьшает счётчик'
+        ' комментариев публикации.'
+    )
+
+
+def test_comments_count_follows_cascades_and_moves(
+        mixer, post_with_published_location, another_user
+):
+    post = post_with_published_location
+    other_post = mixer.blend('blog.Post', author=post.author)
+    comment = mixer.blend('blog.Comment', post=post, author=another_user)
+
+    comment.post = other_post
+    comment.save()
+    assert (_stored_count(post), _stored_count(other_post)) == (0, 1), (
+        'Убедитесь, что при переносе комментария к другой публикации'
+        ' счётчики обеих публикаций пересчитываются.'
+    )
+
+    another_user.delete()
+    assert _stored_count(other_post) == 0, (
+        'Убедитесь, что каскадное удаление комментариев (например, вместе'
+        ' с их автором) уменьшает счётчик комментариев публикации.'
+    )
+
+
+def test_recount_comments_repairs_drift(mixer, comment_to_a_post):
+    post = comment_to_a_post.post
+    Post.objects.filter(pk=post.pk).update(comments_count=42)
+
+    out = StringIO()
+    call_command('recount_comments', '--dry-run', stdout=out)
+    assert f'{post.pk}: 42 -> 1' in out.getvalue(), (
+        'Убедитесь, что команда recount_comments с флагом --dry-run'
+        ' показывает публикации с расхождением.'
+    )
+    assert _stored_count(post) == 42
+
+    call_command('recount_comments', stdout=StringIO())
+
+    assert _stored_count(post) == 1, (
+        'Убедитесь, что команда recount_comments исправляет расхождение'
+        ' счётчика комментариев.'
+    )
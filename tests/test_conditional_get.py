@@ -0,0 +1,107 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import parse_http_date
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.mark.parametrize('client_name', ['user_client', 'unlogged_client'])
+def test_conditional_get(request, client_name, post_with_published_location):
+    client = request.getfixturevalue(client_name)
+    post = post_with_published_location
+    for url in (
+        '/',
+        f'/category/{post.category.slug}/',
+        f'/profile/{post.author.username}/',
+        f'/posts/{post.id}/',
+    ):
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.has_header('ETag') and response.has_header(
+            'Last-Modified'
+        ), f'Убедитесь, что страница {url} отдаёт ETag и Last-Modified.'
+
+        for headers in (
+            {'HTTP_IF_NONE_MATCH': response['ETag']},
+            {'HTTP_IF_MODIFIED_SINCE': response['Last-Modified']},
+        ):
+            assert client.get(url, **headers).status_code == (
+                HTTPStatus.NOT_MODIFIED
+            ), (
+                f'Убедитесь, что неизменившаяся страница {url} возвращает'
+                ' ответ 304.'
+            )
+
+
+def test_conditional_get_changes(
+        user_client, mixer, post_with_published_location
+):
+    post = post_with_published_location
+    url = f'/posts/{post.id}/'
+    etag = user_client.get(url)['ETag']
+    assert 'private' in user_client.get(url)['Cache-Control']
+
+    mixer.blend('blog.Comment', post=post)
+    response = user_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        'Убедитесь, что после добавления комментария страница публикации'
+        ' отдаётся заново.'
+    )
+    assert response['ETag'] != etag
+
+    post.title = 'Новый заголовок'
+    post.save()
+    assert user_client.get(
+        url, HTTP_IF_NONE_MATCH=response['ETag']
+    ).status_code == HTTPStatus.OK, (
+        'Убедитесь, что после изменения публикации страница отдаётся заново.'
+    )
+
+
+def test_etag_depends_on_user(
+        user_client, another_user_client, post_with_published_location
+):
+    url = f'/posts/{post_with_published_location.id}/'
+    assert user_client.get(url)['ETag'] != another_user_client.get(
+        url
+    )['ETag'], (
+        'Убедитесь, что ETag различается для разных пользователей.'
+    )
+
+
+def test_validators_reuse_page_query(
+        user_client, many_posts_with_published_locations
+):
+    with CaptureQueriesContext(connection) as queries:
+        assert user_client.get('/').status_code == HTTPStatus.OK
+    counts = [
+        query['sql'] for query in queries
+        if 'COUNT(' in query['sql'] or 'LIMIT' in query['sql']
+    ]
+    assert len(counts) == len(set(counts)), (
+        'Убедитесь, что ETag и Last-Modified считаются по той же странице'
+        ' публикаций, что попадает в шаблон, без повторных запросов.'
+    )
+
+
+def test_last_modified_not_in_future(
+        user_client, mixer, user, published_category
+):
+    mixer.blend(
+        'blog.Post',
+        author=user,
+        category=published_category,
+        pub_date=timezone.now() + timedelta(days=3)
+    )
+    response = user_client.get(f'/profile/{user.username}/')
+    assert parse_http_date(response['Last-Modified']) <= (
+        timezone.now().timestamp()
+    ), (
+        'Убедитесь, что отложенная публикация не делает Last-Modified'
+        ' датой из будущего.'
+    )
@@ -0,0 +1,49 @@
+import pytest
+from django.db import connection, connections
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _pragma(conn, name):
+    with conn.cursor() as cursor:
+        cursor.execute(f'PRAGMA {name}')
+        return cursor.fetchone()[0]
+
+
+def test_sqlite_pragmas_applied_to_connection():
+    assert _pragma(connection, 'busy_timeout') == 5000, (
+        'Убедитесь, что соединение с SQLite ждёт снятия блокировки'
+        ' (busy_timeout), а не сразу падает с ошибкой.'
+    )
+    assert _pragma(connection, 'synchronous') == 1, (
+        'Убедитесь, что для SQLite включён режим synchronous=NORMAL.'
+    )
+
+
+def test_sqlite_file_database_uses_wal(tmp_path):
+    settings_dict = {
+        **connection.settings_dict, 'NAME': str(tmp_path / 'wal.sqlite3')
+    }
+    file_connection = connections['default'].__class__(settings_dict)
+    try:
+        assert _pragma(file_connection, 'journal_mode') == 'wal', (
+            'Убедитесь, что файловая база SQLite работает в режиме WAL.'
+        )
+    finally:
+        file_connection.close()
+
+
+def test_local_cache_warned_on_deploy(settings):
+    from core.checks import check_shared_cache
+
+    assert [
+        warning.id for warning in check_shared_cache(None)
+    ] == ['core.W001'], (
+        'Убедитесь, что check --deploy предупреждает о кеше, локальном для'
+        ' процесса.'
+    )
+    settings.CACHES = {'default': {
+        'BACKEND': settings.CACHE_BACKENDS['redis'],
+        'LOCATION': 'redis://localhost:6379/0',
+    }}
+    assert check_shared_cache(None) == []
@@ -0,0 +1,63 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _post_queries(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    return response, [
+        query['sql'] for query in queries.captured_queries
+        if 'FROM "blog_post"' in query['sql']
+    ]
+
+
+@pytest.mark.parametrize('published', (True, False))
+def test_author_detail_single_query(
+        user_client, post_with_published_location, published
+):
+    post = post_with_published_location
+    post.is_published = published
+    post.save()
+    response, queries = _post_queries(user_client, f'/posts/{post.id}/')
+    assert response.status_code == HTTPStatus.OK
+    assert len(queries) == 1, (
+        'Убедитесь, что страница публикации загружает публикацию'
+        ' одним запросом для автора.'
+    )
+
+
+def test_non_author_detail_single_query(
+        another_user_client, post_with_published_location
+):
+    post = post_with_published_location
+    response, queries = _post_queries(
+        another_user_client, f'/posts/{post.id}/'
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert len(queries) == 1, (
+        'Убедитесь, что страница публикации загружает публикацию'
+        ' одним запросом для читателя.'
+    )
+
+    post.is_published = False
+    post.save()
+    response, queries = _post_queries(
+        another_user_client, f'/posts/{post.id}/'
+    )
+    assert response.status_code == HTTPStatus.NOT_FOUND, (
+        'Убедитесь, что снятая с публикации запись недоступна читателю.'
+    )
+    assert len(queries) == 1
+
+
+def test_detail_total_queries(
+        user_client, django_assert_max_num_queries,
+        post_with_published_location
+):
+    with django_assert_max_num_queries(5):
+        user_client.get(f'/posts/{post_with_published_location.id}/')
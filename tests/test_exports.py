@@ -0,0 +1,47 @@
+import csv
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.mark.parametrize('action', ('export_csv', 'export_jsonl'))
+def test_admin_export_actions(
+        admin_client, mixer, post_with_published_location, action
+):
+    comments = mixer.cycle(3).blend(
+        'blog.Comment', post=post_with_published_location
+    )
+    response = admin_client.post('/admin/blog/comment/', {
+        'action': action,
+        '_selected_action': [comment.pk for comment in comments[:2]],
+    })
+    assert response.streaming, (
+        'Убедитесь, что выгрузка из админки отдаётся потоком.'
+    )
+    content = b''.join(response.streaming_content).decode('utf-8')
+    if action == 'export_csv':
+        rows = list(csv.DictReader(StringIO(content)))
+    else:
+        rows = [json.loads(line) for line in content.splitlines()]
+    assert [int(row['id']) for row in rows] == [
+        comment.pk for comment in comments[:2]
+    ], 'Убедитесь, что выгружаются только выбранные комментарии.'
+    assert rows[0]['author__username'] == comments[0].author.username
+
+
+def test_export_rows_command(mixer, post_with_published_location):
+    other = mixer.blend('blog.Post', is_published=False)
+    out = StringIO()
+    call_command(
+        'export_rows', 'posts', '--format', 'jsonl',
+        '--filter', 'is_published=True', '--chunk-size', '1',
+        stdout=out
+    )
+    ids = [json.loads(line)['id'] for line in out.getvalue().splitlines()]
+    assert post_with_published_location.pk in ids and other.pk not in ids, (
+        'Убедитесь, что команда export_rows учитывает фильтры.'
+    )
@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from blog import feed
+from blog.models import FeedEntry, Post
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _entry(post):
+    return FeedEntry.objects.filter(post=post).values(
+        'pub_date', 'title', 'category', 'author', 'comment_count'
+    ).first()
+
+
+def test_feed_follows_post_changes(post_with_published_location):
+    post = post_with_published_location
+    assert _entry(post)['title'] == post.title, (
+        'Убедитесь, что опубликованная публикация попадает в таблицу ленты'
+        ' FeedEntry.'
+    )
+
+    post.title = 'Новый заголовок'
+    post.save()
+    assert _entry(post)['title'] == 'Новый заголовок', (
+        'Убедитесь, что изменение публикации обновляет её строку ленты.'
+    )
+
+    post.is_published = False
+    post.save()
+    assert _entry(post) is None, (
+        'Убедитесь, что снятая с публикации запись убирается из ленты.'
+    )
+
+    post.pub_date = timezone.now() + timedelta(days=1)
+    post.is_published = True
+    post.save()
+    assert _entry(post) is not None
+    assert post not in Post.custom_objects.public_feed(), (
+        'Убедитесь, что отложенная публикация хранится в ленте заранее, но'
+        ' не видна до наступления pub_date.'
+    )
+
+
+def test_feed_follows_category_and_comments(
+        mixer, post_with_published_location, another_user
+):
+    post = post_with_published_location
+    category = post.category
+    for _ in range(2):
+        mixer.blend('blog.Comment', post=post, author=another_user)
+    post.comments.first().delete()
+    assert _entry(post)['comment_count'] == 1, (
+        'Убедитесь, что счётчик комментариев в ленте меняется вместе с'
+        ' комментариями.'
+    )
+
+    category.is_published = False
+    category.save()
+    assert not FeedEntry.objects.filter(category=category).exists(), (
+        'Убедитесь, что снятие категории с публикации убирает её записи'
+        ' из ленты.'
+    )
+
+    category.is_published = True
+    category.save()
+    assert _entry(post)['comment_count'] == 1, (
+        'Убедитесь, что при возвращении категории её записи снова попадают'
+        ' в ленту вместе со счётчиком комментариев.'
+    )
+
+
+def test_feed_rebuild_matches_published_post(
+        many_posts_with_published_locations
+):
+    expected = list(
+        Post.custom_objects.comment_count().published_post().values_list(
+            'pk', 'comment_count'
+        )
+    )
+    FeedEntry.objects.all().delete()
+    feed.rebuild()
+    assert list(
+        Post.custom_objects.public_feed().values_list('pk', 'comment_count')
+    ) == expected, (
+        'Убедитесь, что лента из FeedEntry совпадает с published_post()'
+        ' по составу и порядку.'
+    )
@@ -0,0 +1,47 @@
+from io import StringIO
+
+import pytest
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+
+from blog.images import variant_name
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_variants_generated_on_upload(
+        user_client, post_with_published_location
+):
+    name = post_with_published_location.image.name
+    for image_format in ('jpeg', 'webp'):
+        assert default_storage.exists(
+            variant_name(name, 'card', image_format)
+        ), 'Убедитесь, что при загрузке создаются уменьшенные копии.'
+    assert not default_storage.exists(variant_name(name, 'detail', 'jpeg')), (
+        'Убедитесь, что копии шире оригинала не создаются.'
+    )
+
+    for url in ('/', f'/posts/{post_with_published_location.id}/'):
+        content = user_client.get(url).content.decode('utf-8')
+        assert 'type="image/webp"' in content, (
+            f'Убедитесь, что на странице {url} изображение отдаётся'
+            ' в формате WebP через srcset.'
+        )
+        assert default_storage.url(
+            variant_name(name, 'card', 'jpeg')
+        ) in content
+
+
+def test_backfill_command(post_with_published_location):
+    name = post_with_published_location.image.name
+    for image_format in ('jpeg', 'webp'):
+        default_storage.delete(variant_name(name, 'card', image_format))
+
+    call_command(
+        'generate_image_variants', '--workers', '1', stdout=StringIO()
+    )
+
+    assert default_storage.exists(variant_name(name, 'card', 'webp')), (
+        'Убедитесь, что команда generate_image_variants создаёт'
+        ' недостающие копии изображений.'
+    )
@@ -0,0 +1,36 @@
+import pytest
+from django.db import connection
+
+from conftest import N_PER_PAGE
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        connection.vendor != 'sqlite',
+        reason='План запроса проверяется только для SQLite.'
+    ),
+]
+
+
+@pytest.mark.parametrize('client_name', ['user_client', 'another_user_client'])
+def test_list_views_use_feed_indexes(
+        request, client_name, user, many_posts_with_published_locations
+):
+    client = request.getfixturevalue(client_name)
+    category = many_posts_with_published_locations[0].category
+    for url, table in (
+        ('/', 'blog_feedentry'),
+        (f'/category/{category.slug}/', 'blog_feedentry'),
+        (f'/profile/{user.username}/', 'blog_post'),
+    ):
+        response = client.get(url)
+        queryset = response.context['paginator'].object_list
+        plan = queryset[:N_PER_PAGE].explain()
+        assert 'USE TEMP B-TREE' not in plan, (
+            f'Убедитесь, что публикации на странице {url} сортируются'
+            f' по индексу, а не временным B-деревом:\n{plan}'
+        )
+        assert f'SEARCH {table} USING INDEX' in plan, (
+            f'Убедитесь, что публикации на странице {url} выбираются'
+            f' по индексу:\n{plan}'
+        )
@@ -0,0 +1,43 @@
+from http import HTTPStatus
+
+import pytest
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_server_timing_header(user_client, post_with_published_location):
+    response = user_client.get('/')
+    timing = response['Server-Timing']
+    for metric in ('db;dur=', 'view;dur=', 'render;dur=', 'total;dur='):
+        assert metric in timing, (
+            'Убедитесь, что ответ содержит заголовок Server-Timing'
+            ' с замерами базы данных, представления, шаблона и запроса.'
+        )
+
+
+def test_metrics_endpoint(
+        settings, client, user_client, admin_client,
+        post_with_published_location
+):
+    user_client.get(f'/posts/{post_with_published_location.id}/')
+    assert user_client.get('/metrics/').status_code == HTTPStatus.FORBIDDEN, (
+        'Убедитесь, что метрики недоступны обычным пользователям.'
+    )
+    response = admin_client.get('/metrics/')
+    assert response.status_code == HTTPStatus.OK
+    content = response.content.decode('utf-8')
+    assert (
+        'blogicum_request_duration_seconds_count{view="blog:post_detail"}'
+        in content
+    ), 'Убедитесь, что метрики собираются по имени представления.'
+    assert 'blogicum_db_queries_bucket' in content
+
+    settings.METRICS_TOKEN = 'secret'
+    assert client.get(
+        '/metrics/', HTTP_AUTHORIZATION='Bearer secret'
+    ).status_code == HTTPStatus.OK, (
+        'Убедитесь, что метрики доступны по токену METRICS_TOKEN.'
+    )
+    assert client.get(
+        '/metrics/', HTTP_AUTHORIZATION='Bearer wrong'
+    ).status_code == HTTPStatus.FORBIDDEN
@@ -0,0 +1,68 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _count_lookups(client, url, table):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    return sum(
+        f'FROM "{table}"' in query['sql'] for query in queries.captured_queries
+    )
+
+
+def test_category_lookup_memoized(user_client, post_with_published_location):
+    url = f'/category/{post_with_published_location.category.slug}/'
+    assert _count_lookups(user_client, url, 'blog_category') == 1, (
+        'Убедитесь, что категория запрашивается из базы один раз'
+        ' за запрос.'
+    )
+    assert _count_lookups(user_client, url, 'blog_category') == 0, (
+        'Убедитесь, что опубликованная категория берётся из общего кеша.'
+    )
+
+
+def test_profile_lookup_memoized(user_client, another_user):
+    url = f'/profile/{another_user.username}/'
+    assert _count_lookups(user_client, url, 'auth_user') == 2, (
+        'Убедитесь, что автор профиля запрашивается из базы один раз'
+        ' за запрос.'
+    )
+    assert _count_lookups(user_client, url, 'auth_user') == 1, (
+        'Убедитесь, что автор профиля берётся из общего кеша.'
+    )
+
+
+def test_lookup_cache_invalidation(
+        user_client, another_user, post_with_published_location
+):
+    category = post_with_published_location.category
+    old_url = f'/category/{category.slug}/'
+    user_client.get(old_url)
+    category.slug = 'new-slug'
+    category.save()
+    assert user_client.get(old_url).status_code == HTTPStatus.NOT_FOUND, (
+        'Убедитесь, что кеш категории сбрасывается при смене slug.'
+    )
+    assert user_client.get('/category/new-slug/').status_code == (
+        HTTPStatus.OK
+    )
+    category.is_published = False
+    category.save()
+    assert user_client.get('/category/new-slug/').status_code == (
+        HTTPStatus.NOT_FOUND
+    ), 'Убедитесь, что кеш категории сбрасывается при снятии с публикации.'
+
+    user_client.get(f'/profile/{another_user.username}/')
+    another_user.first_name = 'Обновлённое'
+    another_user.save()
+    assert 'Обновлённое' in user_client.get(
+        f'/profile/{another_user.username}/'
+    ).content.decode('utf-8'), (
+        'Убедитесь, что кеш пользователя сбрасывается при его изменении.'
+    )
@@ -0,0 +1,102 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.utils import timezone
+
+from blog.models import OutboxMessage
+from blog.outbox import deliver_pending, enqueue
+
+pytestmark = [pytest.mark.django_db]
+
+
+class FailingBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise ConnectionError('SMTP недоступен')
+
+
+class UnreachableBackend(BaseEmailBackend):
+    def open(self):
+        raise ConnectionRefusedError('SMTP не отвечает')
+
+    def send_messages(self, email_messages):
+        return len(email_messages)
+
+
+def test_flagged_post_enqueues_notification(
+        user_client, published_category
+):
+    user_client.post('/posts/create/', {
+        'title': 'Заголовок',
+        'text': 'Ну и хрен',
+        'pub_date': timezone.now().strftime('%Y-%m-%dT%H:%M'),
+        'category': published_category.id,
+    })
+    assert not mail.outbox, (
+        'Убедитесь, что письмо модератору не отправляется во время запроса.'
+    )
+    assert OutboxMessage.objects.pending().count() == 1, (
+        'Убедитесь, что письмо модератору попадает в очередь исходящих.'
+    )
+
+    call_command('send_outbox', stdout=StringIO())
+    assert len(mail.outbox) == 1
+    assert not OutboxMessage.objects.pending().exists(), (
+        'Убедитесь, что отправленные письма помечаются в очереди.'
+    )
+
+
+def test_messages_digested_per_recipient():
+    for number in range(3):
+        enqueue(f'Пост {number}', 'Текст', ['admin@example.com'])
+    enqueue('Пост', 'Текст', ['other@example.com'])
+
+    assert deliver_pending() == (4, 0)
+    assert sorted(len(message.to) for message in mail.outbox) == [1, 1]
+    digest = next(
+        message for message in mail.outbox
+        if message.to == ['admin@example.com']
+    )
+    assert 'Сводка модерации: 3' in digest.subject, (
+        'Убедитесь, что несколько писем одному получателю объединяются'
+        ' в сводку.'
+    )
+
+
+def test_failed_delivery_retried_with_backoff():
+    enqueue('Пост', 'Текст', ['admin@example.com'])
+
+    assert deliver_pending(backend=f'{__name__}.FailingBackend') == (0, 1)
+    message = OutboxMessage.objects.get()
+    assert message.sent_at is None and message.attempts == 1
+    assert message.next_attempt_at > timezone.now() + timedelta(seconds=30), (
+        'Убедитесь, что после неудачной отправки письмо откладывается.'
+    )
+    assert 'SMTP недоступен' in message.last_error
+
+    assert deliver_pending() == (0, 0)
+    OutboxMessage.objects.update(next_attempt_at=timezone.now())
+    assert deliver_pending() == (1, 0)
+
+
+def test_unreachable_server_reschedules_batch():
+    enqueue('Пост', 'Текст', ['admin@example.com', 'other@example.com'])
+
+    assert deliver_pending(backend=f'{__name__}.UnreachableBackend') == (
+        0, 2
+    ), (
+        'Убедитесь, что ошибка подключения к почтовому серверу не прерывает'
+        ' обработчик очереди.'
+    )
+    for message in OutboxMessage.objects.all():
+        assert message.attempts == 1 and message.sent_at is None
+        assert 'SMTP не отвечает' in message.last_error, (
+            'Убедитесь, что при недоступном сервере вся пачка писем'
+            ' откладывается с записью ошибки.'
+        )
+        assert message.next_attempt_at > timezone.now() + timedelta(
+            seconds=30
+        )
@@ -0,0 +1,101 @@
+from datetime import timedelta
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+
+from blog.cache import publication_timeout
+
+pytestmark = [pytest.mark.django_db]
+
+
+def _is_cached(response):
+    return not response.templates
+
+
+def test_anonymous_pages_cached(
+        unlogged_client, post_with_published_location
+):
+    post = post_with_published_location
+    for url in (
+        '/',
+        f'/category/{post.category.slug}/',
+        f'/posts/{post.id}/',
+    ):
+        assert not _is_cached(unlogged_client.get(url))
+        response = unlogged_client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert _is_cached(response), (
+            f'Убедитесь, что страница {url} для анонимного пользователя'
+            ' отдаётся из кеша.'
+        )
+        assert post.title in response.content.decode('utf-8')
+
+
+def test_authenticated_pages_not_cached(
+        user_client, post_with_published_location
+):
+    user_client.get('/')
+    assert not _is_cached(user_client.get('/')), (
+        'Убедитесь, что страницы авторизованного пользователя не кешируются.'
+    )
+
+
+def test_page_cache_invalidation(
+        unlogged_client, mixer, post_with_published_location
+):
+    post = post_with_published_location
+    detail_url = f'/posts/{post.id}/'
+    category_url = f'/category/{post.category.slug}/'
+    for url in ('/', category_url, detail_url):
+        unlogged_client.get(url)
+
+    mixer.blend('blog.Comment', post=post, text='Свежий комментарий')
+    assert 'Свежий комментарий' in unlogged_client.get(
+        detail_url
+    ).content.decode('utf-8'), (
+        'Убедитесь, что кеш страницы публикации сбрасывается при добавлении'
+        ' комментария.'
+    )
+    assert 'Комментарии (1)' in unlogged_client.get(
+        '/'
+    ).content.decode('utf-8')
+
+    new_post = mixer.blend(
+        'blog.Post',
+        category=post.category,
+        location=post.location,
+        pub_date=timezone.now() - timedelta(minutes=1)
+    )
+    for url in ('/', category_url):
+        assert new_post.title in unlogged_client.get(
+            url
+        ).content.decode('utf-8'), (
+            f'Убедитесь, что кеш страницы {url} сбрасывается при появлении'
+            ' новой публикации.'
+        )
+
+    post.category.is_published = False
+    post.category.save()
+    assert unlogged_client.get(category_url).status_code == (
+        HTTPStatus.NOT_FOUND
+    ), (
+        'Убедитесь, что кеш страницы категории сбрасывается при снятии'
+        ' категории с публикации.'
+    )
+    assert post.title not in unlogged_client.get(
+        '/'
+    ).content.decode('utf-8')
+
+
+def test_page_cache_expires_at_next_publication(mixer):
+    assert publication_timeout(3600) == 3600
+    mixer.blend(
+        'blog.Post',
+        is_published=True,
+        pub_date=timezone.now() + timedelta(seconds=120)
+    )
+    assert 0 < publication_timeout(3600) <= 120, (
+        'Убедитесь, что срок жизни кеша страниц не превышает времени до'
+        ' ближайшей отложенной публикации.'
+    )
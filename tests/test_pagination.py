@@ -0,0 +1,56 @@
+from http import HTTPStatus
+
+import pytest
+from django.test import override_settings
+
+from conftest import N_PER_PAGE
+
+pytestmark = [pytest.mark.django_db]
+
+
+@override_settings(BLOG_CURSOR_PAGINATION=True)
+def test_cursor_pagination(
+        user_client, many_posts_with_published_locations
+):
+    first_page = user_client.get('/').context['page_obj']
+    assert len(first_page) == N_PER_PAGE, (
+        'Убедитесь, что курсорная пагинация отдаёт полную первую страницу.'
+    )
+    assert first_page.has_next() and not first_page.has_previous()
+
+    second_page = user_client.get(
+        '/', {'cursor': first_page.next_cursor}
+    ).context['page_obj']
+    seen_ids = {post.id for post in first_page}
+    assert not seen_ids & {post.id for post in second_page}, (
+        'Убедитесь, что страницы курсорной пагинации не пересекаются.'
+    )
+    expected = sorted(
+        many_posts_with_published_locations,
+        key=lambda post: (-post.pub_date.timestamp(), post.title, post.id)
+    )
+    assert [post.id for post in [*first_page, *second_page]] == [
+        post.id for post in expected
+    ], (
+        'Убедитесь, что курсорная пагинация сохраняет порядок публикаций.'
+    )
+    assert not second_page.has_next()
+
+    previous_page = user_client.get(
+        '/', {'cursor': second_page.previous_cursor}
+    ).context['page_obj']
+    assert [post.id for post in previous_page] == [
+        post.id for post in first_page
+    ], (
+        'Убедитесь, что переход на предыдущую страницу возвращает'
+        ' первую страницу.'
+    )
+    assert not previous_page.has_previous()
+
+
+@override_settings(BLOG_CURSOR_PAGINATION=True)
+def test_cursor_pagination_bad_token(user_client):
+    response = user_client.get('/', {'cursor': 'not-a-cursor'})
+    assert response.status_code == HTTPStatus.NOT_FOUND, (
+        'Убедитесь, что некорректный курсор страницы приводит к ошибке 404.'
+    )
@@ -0,0 +1,64 @@
+import pytest
+
+pytestmark = [pytest.mark.django_db]
+
+POST_CARD_TEMPLATE = 'includes/post_card.html'
+
+
+def _rendered_templates(response):
+    return [template.name for template in response.templates]
+
+
+def test_post_card_rendered_from_cache(
+        user_client, post_with_published_location
+):
+    post = post_with_published_location
+    response = user_client.get('/')
+    assert POST_CARD_TEMPLATE in _rendered_templates(response)
+
+    response = user_client.get('/')
+    assert POST_CARD_TEMPLATE not in _rendered_templates(response), (
+        'Убедитесь, что карточка публикации при повторном запросе'
+        ' берётся из кеша.'
+    )
+    assert post.title in response.content.decode('utf-8')
+
+
+def test_post_card_cache_invalidation(
+        user_client, post_with_published_location
+):
+    post = post_with_published_location
+    user_client.get('/')
+
+    post.title = 'Обновлённый заголовок'
+    post.save()
+    assert 'Обновлённый заголовок' in user_client.get(
+        '/'
+    ).content.decode('utf-8'), (
+        'Убедитесь, что кеш карточки сбрасывается при изменении публикации.'
+    )
+
+    post.category.title = 'Обновлённая категория'
+    post.category.save()
+    assert 'Обновлённая категория' in user_client.get(
+        '/'
+    ).content.decode('utf-8'), (
+        'Убедитесь, что кеш карточки сбрасывается при изменении категории.'
+    )
+
+    post.location.name = 'Обновлённое место'
+    post.location.save()
+    assert 'Обновлённое место' in user_client.get(
+        '/'
+    ).content.decode('utf-8'), (
+        'Убедитесь, что кеш карточки сбрасывается при изменении'
+        ' местоположения.'
+    )
+
+    user_client.post(f'/posts/{post.id}/comment/', {'text': 'Комментарий'})
+    assert 'Комментарии (1)' in user_client.get(
+        '/'
+    ).content.decode('utf-8'), (
+        'Убедитесь, что кеш карточки сбрасывается при добавлении'
+        ' комментария.'
+    )
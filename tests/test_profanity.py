@@ -0,0 +1,85 @@
+import pytest
+
+from blog.forms import CommentForm
+from blog.profanity import AhoCorasick, Dictionary, find_profanity
+
+
+def test_automaton_finds_overlapping_words():
+    matcher = AhoCorasick({'he', 'she', 'hers', 'his'})
+    assert matcher.find('ushers') == 'she'
+    assert matcher.find('ahishers') == 'his'
+    assert matcher.find('nothing here') == 'he'
+    assert matcher.find('xyz') is None
+
+
+@pytest.mark.parametrize('text', [
+    'Какой хрен это написал',
+    'ХРЕНОВЫЙ день',
+    'xрен латинской буквой',
+    'хpeн смешанными буквами',
+])
+def test_find_profanity_normalizes_text(text):
+    assert find_profanity(text), (
+        'Убедитесь, что фильтр находит слова из словаря в любом регистре'
+        ' и с латинскими буквами-двойниками.'
+    )
+
+
+def test_automaton_iterates_all_matches():
+    matcher = AhoCorasick({'he', 'she', 'hers'})
+    assert sorted(matcher.iter_matches('ushers')) == [
+        (4, 'he'), (4, 'she'), (6, 'hers')
+    ]
+
+
+def test_dictionary_patterns_and_exclusions():
+    dictionary = Dictionary({'хер', 'бля*', '*пизд*', '!бляха*'})
+    assert dictionary.find('вот хер') == 'хер'
+    assert dictionary.find('херсон') is None, (
+        'Убедитесь, что запись без звёздочки совпадает только с целым'
+        ' словом.'
+    )
+    assert dictionary.find('блядство') == 'бля'
+    assert dictionary.find('употреблять') is None, (
+        'Убедитесь, что запись «основа*» совпадает только с началом слова.'
+    )
+    assert dictionary.find('распиздяй') == 'пизд'
+    assert dictionary.find('бляха ремня') is None, (
+        'Убедитесь, что исключения с «!» отменяют совпадение по основе.'
+    )
+
+
+@pytest.mark.parametrize('text', [
+    'Обычный приличный текст',
+    'Тебе без хлеба',
+    'Застрахуй машину',
+    'Мандарин для командира',
+    'Бляха ремня',
+    'Трахея и сражение',
+    'Употреблять с корабля',
+])
+def test_find_profanity_clean_text(text):
+    assert find_profanity(text) is None, (
+        'Убедитесь, что словарь не считает бранными обычные слова,'
+        ' содержащие основы из словаря.'
+    )
+
+
+@pytest.mark.parametrize('text', [
+    'Охренеть',
+    'Заебал',
+    'ёб твою',
+    'Блядство',
+    'Какое говёное утро',
+])
+def test_find_profanity_word_forms(text):
+    assert find_profanity(text), (
+        'Убедитесь, что основы из словаря находят разные словоформы.'
+    )
+
+
+def test_comment_form_rejects_profanity():
+    form = CommentForm(data={'text': 'Ну и хрен с ним'})
+    assert not form.is_valid(), (
+        'Убедитесь, что форма комментария не пропускает нецензурные слова.'
+    )
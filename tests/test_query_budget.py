@@ -0,0 +1,57 @@
+import pytest
+
+from blog.models import Post
+from blog.views import PostListView
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.allow_query_budget,
+]
+
+
+def test_budget_exceeded_reported(
+        monkeypatch, caplog, query_budget, user_client,
+        post_with_published_location
+):
+    monkeypatch.setattr(PostListView, 'query_budget', 1)
+    user_client.get('/')
+    assert len(query_budget) == 1 and 'PostListView' in query_budget[0], (
+        'Убедитесь, что превышение бюджета запросов представления'
+        ' отправляет сигнал query_budget_exceeded.'
+    )
+    assert 'при бюджете 1' in caplog.text, (
+        'Убедитесь, что превышение бюджета запросов пишется в лог.'
+    )
+
+
+def test_n_plus_one_detected(
+        monkeypatch, query_budget, user_client,
+        many_posts_with_published_locations
+):
+    monkeypatch.setattr(
+        PostListView,
+        'get_queryset',
+        lambda view: Post.custom_objects.public_feed().select_related(None)
+    )
+    user_client.get('/')
+    assert query_budget and 'FROM "blog_category"' in query_budget[0], (
+        'Убедитесь, что повторяющиеся запросы связанных объектов (N+1)'
+        ' обнаруживаются.'
+    )
+
+
+def test_views_within_budget(
+        query_budget, user_client, many_posts_with_published_locations
+):
+    post = many_posts_with_published_locations[0]
+    for url in (
+        '/',
+        f'/category/{post.category.slug}/',
+        f'/profile/{post.author.username}/',
+        f'/posts/{post.id}/',
+    ):
+        user_client.get(url)
+    assert not query_budget, (
+        'Убедитесь, что страницы блога укладываются в бюджет запросов:\n'
+        + '\n'.join(query_budget)
+    )
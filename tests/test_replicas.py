@@ -0,0 +1,134 @@
+import sqlite3
+
+import pytest
+from django.core.cache import cache
+from django.db import connection, router
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from blog.cache import (
+    category_key, get_published_category, new_version, post_tags,
+    set_cached_page
+)
+from blog.models import Post, User
+from core import db
+from core.db import copy_sqlite, replica_reads
+from core.middleware import REPLICA_PIN_COOKIE, ReplicaRoutingMiddleware
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def replicas(settings):
+    settings.REPLICA_DATABASES = ['replica1']
+
+
+def _read_databases(request):
+    routed = {}
+
+    def get_response(request):
+        routed['post'] = router.db_for_read(Post)
+        routed['user'] = router.db_for_read(User)
+        return HttpResponse()
+
+    response = ReplicaRoutingMiddleware(get_response)(request)
+    return routed, response
+
+
+def test_safe_requests_read_from_replicas(replicas):
+    factory = RequestFactory()
+    routed, response = _read_databases(factory.get('/'))
+    assert routed == {'post': 'replica1', 'user': 'default'}, (
+        'Убедитесь, что GET-запросы читают публикации с реплики, а'
+        ' пользователей и сессии -- с основной базы.'
+    )
+    assert REPLICA_PIN_COOKIE not in response.cookies
+
+    assert _read_databases(factory.get('/admin/'))[0]['post'] == 'default', (
+        'Убедитесь, что админка всегда работает с основной базой.'
+    )
+    assert router.db_for_read(Post) == 'default', (
+        'Убедитесь, что вне запроса (команды, фоновые задачи) чтение идёт'
+        ' с основной базы.'
+    )
+
+
+def test_reads_stick_to_primary_after_write(replicas):
+    factory = RequestFactory()
+    routed, response = _read_databases(factory.post('/posts/1/comment/'))
+    assert routed['post'] == 'default'
+    assert REPLICA_PIN_COOKIE in response.cookies, (
+        'Убедитесь, что после записи браузер получает cookie, закрепляющую'
+        ' чтение за основной базой.'
+    )
+
+    request = factory.get('/')
+    request.COOKIES[REPLICA_PIN_COOKIE] = '1'
+    assert _read_databases(request)[0]['post'] == 'default', (
+        'Убедитесь, что автор сразу после записи читает с основной базы.'
+    )
+
+
+def test_lagging_replica_reads_not_cached(
+        replicas, settings, post_with_published_location
+):
+    # Реплика -- та же база: важно лишь, что запрос читает «с реплики».
+    settings.REPLICA_APP_LABELS = ()
+    post = post_with_published_location
+    tags = post_tags(post)
+    started = new_version()
+    with replica_reads():
+        set_cached_page('page', HttpResponse('старое'), tags, started)
+        get_published_category(post.category.slug)
+    assert cache.get('page') is None, (
+        'Убедитесь, что страница, прочитанная с реплики вскоре после'
+        ' записи, не попадает в кеш под новой версией.'
+    )
+    assert cache.get(category_key(post.category.slug)) is None
+
+    lag_passed = int(started) + (settings.REPLICA_MAX_LAG + 1) * 10 ** 9
+    with replica_reads():
+        set_cached_page('page', HttpResponse('новое'), tags, lag_passed)
+    assert cache.get('page') is not None, (
+        'Убедитесь, что после REPLICA_MAX_LAG страницы с реплик снова'
+        ' кешируются.'
+    )
+
+
+def test_comment_sets_pin_cookie(
+        replicas, user_client, post_with_published_location
+):
+    post = post_with_published_location
+    response = user_client.post(
+        f'/posts/{post.id}/comment/', {'text': 'Комментарий'}
+    )
+    assert REPLICA_PIN_COOKIE in response.cookies
+    assert 'Комментарий' in user_client.get(
+        f'/posts/{post.id}/'
+    ).content.decode('utf-8')
+
+
+@pytest.mark.django_db(transaction=True)
+def test_copy_sqlite(tmp_path, post_with_published_location):
+    post = post_with_published_location
+    path = tmp_path / 'replica.sqlite3'
+    copy_sqlite(connection, path)
+    replica = sqlite3.connect(path)
+    try:
+        titles = replica.execute('SELECT title FROM blog_post').fetchall()
+    finally:
+        replica.close()
+    assert titles == [(post.title,)], (
+        'Убедитесь, что sync_replicas копирует данные основной базы в'
+        ' реплику.'
+    )
+
+
+def test_copy_sqlite_gives_up_when_locked(
+        monkeypatch, tmp_path, post_with_published_location
+):
+    # Открытая транзакция теста держит блокировку исходной базы.
+    monkeypatch.setattr(db, 'SQLITE_BACKUP_RETRIES', 1)
+    monkeypatch.setattr(db, 'SQLITE_BACKUP_SLEEP', 0)
+    with pytest.raises(sqlite3.OperationalError):
+        copy_sqlite(connection, tmp_path / 'replica.sqlite3')
@@ -0,0 +1,75 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+
+from blog.cache import (
+    SCHEDULER_HEARTBEAT_KEY, get_versions, publication_timeout
+)
+from blog.scheduler import PROMOTED_UNTIL_KEY, heartbeat, promote_due
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def scheduler_state():
+    yield
+    cache.delete_many([SCHEDULER_HEARTBEAT_KEY, PROMOTED_UNTIL_KEY])
+
+
+def test_promote_due_bumps_deferred_post_tags(mixer):
+    now = timezone.now()
+    post = mixer.blend(
+        'blog.Post',
+        is_published=True,
+        pub_date=now + timedelta(hours=1)
+    )
+    tags = ('feed', f'category:{post.category_id}', f'post:{post.pk}')
+    assert promote_due(now) == 0
+    versions = get_versions(*tags)
+    assert promote_due(now + timedelta(minutes=30)) == 0
+    assert get_versions(*tags) == versions, (
+        'Убедитесь, что до наступления pub_date кеш не сбрасывается.'
+    )
+
+    assert promote_due(now + timedelta(hours=2)) == 1
+    assert all(
+        old != new
+        for old, new in zip(versions[1:], get_versions(*tags)[1:])
+    ), (
+        'Убедитесь, что в момент отложенной публикации сбрасываются'
+        ' кеш ленты, категории и самой публикации.'
+    )
+
+
+def test_heartbeat_keeps_full_page_timeout(mixer):
+    mixer.blend(
+        'blog.Post',
+        is_published=True,
+        pub_date=timezone.now() + timedelta(seconds=120)
+    )
+    assert publication_timeout(3600) <= 120
+    heartbeat(60)
+    assert publication_timeout(3600) == 3600, (
+        'Убедитесь, что при работающей publish_scheduled страницы'
+        ' кешируются на полный срок.'
+    )
+
+
+def test_publish_scheduled_command(mixer):
+    call_command('publish_scheduled', stdout=StringIO())
+    mixer.blend(
+        'blog.Post',
+        is_published=True,
+        pub_date=timezone.now() - timedelta(seconds=1)
+    )
+    cache.set(PROMOTED_UNTIL_KEY, timezone.now() - timedelta(minutes=1))
+    out = StringIO()
+    call_command('publish_scheduled', stdout=out)
+    assert 'Вышло публикаций: 1' in out.getvalue(), (
+        'Убедитесь, что команда publish_scheduled обрабатывает публикации,'
+        ' чья pub_date наступила с прошлого запуска.'
+    )
@@ -0,0 +1,77 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+
+from blog.models import Post
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(
+        connection.vendor != 'sqlite',
+        reason='Поиск в тестах проверяется на индексе FTS5.'
+    ),
+]
+
+
+def _found(client, query):
+    response = client.get('/search/', {'q': query})
+    return [post.id for post in response.context['page_obj']]
+
+
+def test_search_ranked_and_published_only(
+        user_client, mixer, published_category, published_location
+):
+    kwargs = {
+        'category': published_category,
+        'location': published_location,
+        'is_published': True,
+        'pub_date': timezone.now() - timedelta(days=1),
+    }
+    weak = mixer.blend(
+        'blog.Post', title='Заметки', text='Про пингвинов немного.',
+        **kwargs
+    )
+    strong = mixer.blend(
+        'blog.Post', title='Пингвины', text='Пингвины и снова пингвины.',
+        **kwargs
+    )
+    mixer.blend(
+        'blog.Post', title='Пингвины', text='Черновик.',
+        **{**kwargs, 'is_published': False}
+    )
+    mixer.blend(
+        'blog.Post', title='Пингвины', text='Отложенная.',
+        **{**kwargs, 'pub_date': timezone.now() + timedelta(days=1)}
+    )
+
+    assert _found(user_client, 'пингвин') == [strong.id, weak.id], (
+        'Убедитесь, что поиск находит только опубликованные публикации'
+        ' и сортирует их по релевантности.'
+    )
+    assert _found(user_client, '"') == []
+
+
+def test_search_index_follows_changes(user_client, post_with_published_location):
+    post = post_with_published_location
+    post.title = 'Кашалоты'
+    post.save()
+    assert _found(user_client, 'кашалоты') == [post.id], (
+        'Убедитесь, что поисковый индекс обновляется при сохранении'
+        ' публикации.'
+    )
+
+    Post.objects.filter(pk=post.pk).update(title='Нарвалы')
+    assert _found(user_client, 'нарвалы') == []
+    call_command('rebuild_search_index', stdout=StringIO())
+    assert _found(user_client, 'нарвалы') == [post.id], (
+        'Убедитесь, что команда rebuild_search_index перестраивает индекс.'
+    )
+
+    post.delete()
+    assert _found(user_client, 'нарвалы') == [], (
+        'Убедитесь, что удалённая публикация пропадает из поиска.'
+    )
@@ -0,0 +1,89 @@
+import json
+from http import HTTPStatus
+
+import pytest
+
+pytestmark = [pytest.mark.django_db]
+
+CONTENT_TYPES = {
+    'rss': 'application/rss+xml',
+    'atom': 'application/atom+xml',
+    'json': 'application/feed+json',
+}
+
+
+def _feed_urls(post):
+    return (
+        '/feeds/{}/',
+        f'/category/{post.category.slug}/feeds/{{}}/',
+        f'/profile/{post.author.username}/feeds/{{}}/',
+    )
+
+
+def test_feeds_list_published_posts(
+        unlogged_client, post_with_published_location
+):
+    post = post_with_published_location
+    for url in _feed_urls(post):
+        for feed_format, content_type in CONTENT_TYPES.items():
+            response = unlogged_client.get(url.format(feed_format))
+            assert response.status_code == HTTPStatus.OK
+            assert response['Content-Type'].startswith(content_type), (
+                f'Убедитесь, что лента {url.format(feed_format)} отдаётся'
+                f' с типом {content_type}.'
+            )
+            assert post.title in response.content.decode('utf-8'), (
+                'Убедитесь, что в ленты попадают опубликованные записи.'
+            )
+    feed = json.loads(unlogged_client.get('/feeds/json/').content)
+    assert feed['items'][0]['url'].endswith(f'/posts/{post.id}/'), (
+        'Убедитесь, что JSON Feed содержит ссылки на публикации.'
+    )
+    assert unlogged_client.get('/feeds/xml/').status_code == (
+        HTTPStatus.NOT_FOUND
+    )
+
+
+def test_feed_conditional_get(
+        unlogged_client, post_with_published_location,
+        django_assert_max_num_queries
+):
+    post = post_with_published_location
+    url = f'/category/{post.category.slug}/feeds/atom/'
+    etag = unlogged_client.get(url)['ETag']
+    with django_assert_max_num_queries(1):
+        response = unlogged_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+        'Убедитесь, что ленты поддерживают условный GET и без изменений'
+        ' отвечают 304.'
+    )
+    with django_assert_max_num_queries(1):
+        assert unlogged_client.get(url).status_code == HTTPStatus.OK
+
+    post.title = 'Новый заголовок'
+    post.save()
+    response = unlogged_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK, (
+        'Убедитесь, что изменение публикации меняет ETag ленты.'
+    )
+    assert 'Новый заголовок' in response.content.decode('utf-8'), (
+        'Убедитесь, что кеш ленты сбрасывается при изменении публикации.'
+    )
+
+
+def test_feed_hides_unpublished(
+        unlogged_client, post_with_published_location
+):
+    post = post_with_published_location
+    url = '/feeds/rss/'
+    unlogged_client.get(url)
+    post.is_published = False
+    post.save()
+    assert post.title not in unlogged_client.get(
+        url
+    ).content.decode('utf-8')
+    post.category.is_published = False
+    post.category.save()
+    assert unlogged_client.get(
+        f'/category/{post.category.slug}/feeds/rss/'
+    ).status_code == HTTPStatus.NOT_FOUND
@@ -0,0 +1,117 @@
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from blog.models import Category, Comment, Location, Post, User
+from blog.transfer import iter_json_array
+
+pytestmark = [pytest.mark.django_db]
+
+FIXTURE = Path(__file__).resolve().parent.parent / 'db.json'
+
+
+@pytest.mark.parametrize('read_size', (1, 7, 4096))
+def test_iter_json_array_matches_json_load(read_size):
+    with open(FIXTURE, encoding='utf-8') as stream:
+        expected = json.load(stream)
+    with open(FIXTURE, encoding='utf-8') as stream:
+        assert list(iter_json_array(stream, read_size)) == expected, (
+            'Убедитесь, что потоковый разбор JSON не зависит от размера'
+            ' читаемых кусков.'
+        )
+
+
+def test_iter_json_array_rejects_truncated_input():
+    with pytest.raises(ValueError):
+        list(iter_json_array(StringIO('[{"model": "blog.post"},'), 4))
+
+
+def test_import_fixture(client):
+    call_command('import_blog_data', str(FIXTURE), stdout=StringIO())
+    assert Post.objects.count() == 39, (
+        'Убедитесь, что команда import_blog_data загружает публикации'
+        ' из db.json.'
+    )
+    assert Category.objects.count() == 6
+    assert Location.objects.count() == 12
+    assert User.objects.filter(username='admin').exists()
+    assert client.get('/search/', {'q': 'Обед'}).context[
+        'page_obj'
+    ].paginator.count >= 1, (
+        'Убедитесь, что после загрузки перестраивается поисковый индекс.'
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_out_of_order_records(tmp_path):
+    # В db.json публикации идут раньше своих авторов; внешние ключи
+    # проверяются при настоящем коммите, поэтому тест без обёртки теста
+    # в транзакцию.
+    call_command(
+        'import_blog_data', str(FIXTURE), '--batch-size', '10',
+        stdout=StringIO()
+    )
+    assert Post.objects.count() == 39, (
+        'Убедитесь, что import_blog_data загружает записи, идущие раньше'
+        ' тех, на которые они ссылаются.'
+    )
+
+    broken = tmp_path / 'broken.json'
+    broken.write_text(json.dumps([
+        {'model': 'blog.location', 'pk': 100, 'fields': {
+            'name': 'Место', 'is_published': True,
+            'created_at': '2024-01-01T00:00:00Z',
+        }},
+        {'model': 'blog.comment', 'pk': 100, 'fields': {
+            'text': 'Ничей', 'post': 10 ** 6, 'author': 10 ** 6,
+            'created_at': '2024-01-01T00:00:00Z',
+        }},
+    ]), encoding='utf-8')
+    with pytest.raises(CommandError):
+        call_command(
+            'import_blog_data', str(broken), '--batch-size', '1',
+            stdout=StringIO()
+        )
+    assert not Location.objects.filter(pk=100).exists(), (
+        'Убедитесь, что при ошибке загрузки в базе не остаются уже'
+        ' вставленные пачки.'
+    )
+
+
+def test_export_import_round_trip(
+        tmp_path, user_client, mixer, post_with_published_location
+):
+    post = post_with_published_location
+    mixer.cycle(3).blend('blog.Comment', post=post)
+    user_client.get('/')
+    path = tmp_path / 'export.json'
+    call_command(
+        'export_blog_data', str(path), '--chunk-size', '2', stdout=StringIO()
+    )
+    exported = json.loads(path.read_text(encoding='utf-8'))
+    assert {record['model'] for record in exported} == {
+        'auth.user', 'blog.category', 'blog.location', 'blog.post',
+        'blog.comment',
+    }
+
+    User.objects.all().delete()
+    Category.objects.all().delete()
+    Location.objects.all().delete()
+    call_command(
+        'import_blog_data', str(path), '--batch-size', '2', stdout=StringIO()
+    )
+
+    restored = Post.objects.get(pk=post.pk)
+    assert restored.title == post.title
+    assert Comment.objects.filter(post=restored).count() == 3
+    assert restored.comments_count == 3, (
+        'Убедитесь, что после загрузки пересчитываются счётчики'
+        ' комментариев.'
+    )
+    user_client.force_login(User.objects.get(pk=post.author_id))
+    assert 'Комментарии (3)' in user_client.get('/').content.decode('utf-8'), (
+        'Убедитесь, что после загрузки сбрасывается кеш страниц.'
+    )